@@ -0,0 +1,109 @@
+# benchmarks/ir_build_benchmark.py
+#
+# Compare eager vs lazy IR construction on synthetic repository- and DTO-heavy inputs.
+# Run from the repository root:  python -m benchmarks.ir_build_benchmark [--classes N]
+
+import argparse
+import time
+import tracemalloc
+
+from ir.ir_builder import build_ir_from_json
+
+
+def repository_record(i: int) -> dict:
+    return {
+        "name": f"Entity{i}Repository",
+        "decorators": ["@Injectable()"],
+        "extends": f"Repository<Entity{i}>",
+        "implements": [],
+        "properties": [],
+        "constructorParams": [
+            {"name": "dataSource", "type": "DataSource", "decorators": ["@InjectDataSource()"]},
+        ],
+        "methods": [
+            {
+                "name": f"findBy{field}",
+                "returnType": f"Promise<Entity{i} | null>",
+                "decorators": [],
+                "parameters": [{"name": field.lower(), "type": "string", "decorators": []}],
+            }
+            for field in ("Id", "Email", "Name", "Status", "CreatedAt", "UpdatedAt", "Owner", "Tag")
+        ],
+    }
+
+
+def dto_record(i: int) -> dict:
+    return {
+        "name": f"Create{i}Dto",
+        "decorators": [],
+        "extends": None,
+        "implements": [],
+        "properties": [
+            {
+                "name": f"field{n}",
+                "type": "string",
+                "isReadonly": False,
+                "access": "public",
+                "decorators": ["@IsString()", "@ApiProperty({ required: false })"],
+            }
+            for n in range(12)
+        ],
+        "constructorParams": [],
+        "methods": [
+            {
+                "name": "validate",
+                "returnType": "boolean",
+                "decorators": [],
+                "parameters": [{"name": "strict", "type": "boolean", "decorators": []}],
+            },
+        ],
+    }
+
+
+def consume_repository(ir_class):
+    # RepositoryGenerator only reads the name
+    return ir_class.name
+
+
+def consume_dto(ir_class):
+    # DtoGenerator reads properties, never methods or constructor params
+    return [(p.name, p.type) for p in ir_class.properties]
+
+
+def measure(records, lazy: bool, consume):
+    tracemalloc.start()
+    start = time.perf_counter()
+    classes = build_ir_from_json(records, lazy=lazy)
+    for ir_class in classes:
+        consume(ir_class)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark eager vs lazy IR construction.")
+    parser.add_argument("--classes", type=int, default=5000, help="Synthetic classes per workload (default: 5000)")
+    args = parser.parse_args()
+
+    workloads = [
+        ("repository-heavy", [repository_record(i) for i in range(args.classes)], consume_repository),
+        ("dto-heavy", [dto_record(i) for i in range(args.classes)], consume_dto),
+    ]
+
+    print(f"{'workload':<18} {'mode':<6} {'time (ms)':>10} {'peak (KiB)':>11}")
+    for label, records, consume in workloads:
+        # Warm the decorator cache so both modes pay the same parsing cost
+        build_ir_from_json(records[:1])
+        results = {}
+        for mode, lazy in (("eager", False), ("lazy", True)):
+            elapsed, peak = measure(records, lazy, consume)
+            results[mode] = (elapsed, peak)
+            print(f"{label:<18} {mode:<6} {elapsed * 1000:>10.1f} {peak / 1024:>11.0f}")
+        (eager_t, eager_m), (lazy_t, lazy_m) = results["eager"], results["lazy"]
+        print(f"{'':<18} {'saved':<6} {(1 - lazy_t / eager_t) * 100:>9.0f}% {(1 - lazy_m / eager_m) * 100:>10.0f}%")
+
+
+if __name__ == "__main__":
+    main()
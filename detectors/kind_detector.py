@@ -0,0 +1,43 @@
+# detectors/kind_detector.py
+
+from typing import Optional
+from .repository_detector import is_repository_class
+
+# Order matters: a class is assigned the first kind that matches
+JAVA_KINDS = ["controller", "repository", "service", "dto", "entity"]
+
+
+def detect_kind(ir_class) -> Optional[str]:
+    decorator_names = [d.name.lower() for d in ir_class.decorators]
+
+    if "controller" in decorator_names:
+        return "controller"
+    if is_repository_class(ir_class):
+        return "repository"
+    if "service" in decorator_names or "injectable" in decorator_names:
+        return "service"
+    if ir_class.name.endswith("Dto") and not decorator_names:
+        return "dto"
+    if "entity" in decorator_names:
+        return "entity"
+    return None
+
+
+def possible_kinds(class_names, decorator_names) -> set:
+    """
+    Text-level over-approximation of detect_kind for a whole file, used before
+    parsing. Never misses a kind detect_kind could assign to a class in the file.
+    """
+    decorators = {d.lower() for d in decorator_names}
+    kinds = set()
+    if "controller" in decorators:
+        kinds.add("controller")
+    if "repository" in decorators or any(n.lower().endswith("repository") for n in class_names):
+        kinds.add("repository")
+    if "service" in decorators or "injectable" in decorators:
+        kinds.add("service")
+    if any(n.endswith("Dto") for n in class_names):
+        kinds.add("dto")
+    if "entity" in decorators:
+        kinds.add("entity")
+    return kinds
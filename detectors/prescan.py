@@ -0,0 +1,78 @@
+# detectors/prescan.py
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .kind_detector import possible_kinds
+
+_DECORATOR = re.compile(r"@\s*([A-Za-z_$][\w$]*)")
+_CLASS = re.compile(r"\bclass\s+([A-Za-z_$][\w$]*)")
+
+
+@dataclass
+class PrescanInfo:
+    classes: List[str]
+    decorators: List[str]
+
+    def may_match(self, kinds: Optional[set] = None, class_names: Optional[set] = None) -> bool:
+        if class_names and not class_names.intersection(self.classes):
+            return False
+        if kinds and not kinds & possible_kinds(self.classes, self.decorators):
+            return False
+        return True
+
+
+class PrescanIndex:
+    """
+    Cheap regex scan of a file's raw text for class names and decorator names,
+    so --only/--classes can drop files before they are sent to the bridge.
+    Results are cached per file and reused while mtime and size are unchanged.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries: Dict[str, list] = {}
+        self.scanned = 0
+        self.reused = 0
+        self._dirty = False
+        if self.cache_path and self.cache_path.is_file():
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def scan(self, path: str) -> PrescanInfo:
+        st = os.stat(path)
+        entry = self.entries.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.reused += 1
+            return PrescanInfo(classes=entry[2], decorators=entry[3])
+
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        info = PrescanInfo(
+            classes=sorted(set(_CLASS.findall(text))),
+            decorators=sorted(set(_DECORATOR.findall(text))),
+        )
+        self.entries[path] = [st.st_mtime_ns, st.st_size, info.classes, info.decorators]
+        self.scanned += 1
+        self._dirty = True
+        return info
+
+    def select(self, paths: Iterable[str], kinds: Optional[set] = None, class_names: Optional[set] = None) -> List[str]:
+        return [p for p in paths if self.scan(p).may_match(kinds, class_names)]
+
+    def save(self):
+        if not (self.cache_path and self._dirty):
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.cache_path)
+        self._dirty = False
@@ -2,19 +2,50 @@ from pathlib import Path
 from ir.ir_models import IRClass
 from .type_mapper import map_ts_type_to_java
 from utils.import_optimizer import ImportOptimizer
+from .fingerprint import JAVA_SOURCE_ROOT, decorator_signatures, method_signatures
 
 
 class ControllerGenerator:
+    VERSION = "1"
+
     def __init__(self, base_package: str = "com.example.demo", base_output_dir: Path = Path("out")):
         self.base_package = base_package
         self.base_output_dir = base_output_dir
         self.import_optimizer = ImportOptimizer()
 
     def generate_and_save(self, ir_class: IRClass):
+        outputs = self.render(ir_class)
+        self.save(outputs)
+        return outputs
+
+    def render(self, ir_class: IRClass) -> list[tuple[Path, str]]:
+        """Return (path relative to base_output_dir, Java source) for each output file."""
         kind = self._infer_kind(ir_class)
         package = f"{self.base_package}.{kind}"
         java_code, imports = self._generate_class_code(ir_class, package, kind)
-        self._save(java_code, ir_class.name, kind, imports)
+        java_code = self.import_optimizer.optimize(imports, java_code)
+        rel_path = Path(JAVA_SOURCE_ROOT, *self.base_package.split("."), kind, f"{ir_class.name}.java")
+        return [(rel_path, java_code)]
+
+    def fingerprint(self, ir_class: IRClass) -> list:
+        return [
+            ir_class.name,
+            decorator_signatures(ir_class.decorators),
+            ir_class.extends,
+            ir_class.implements,
+            method_signatures(ir_class),
+        ]
+
+    def cache_config(self) -> dict:
+        return {"base_package": self.base_package, "layout": JAVA_SOURCE_ROOT}
+
+    def save(self, outputs: list[tuple[Path, str]]):
+        for rel_path, java_code in outputs:
+            file_path = self.base_output_dir / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "w") as f:
+                f.write(java_code)
+            print(f"✅ Saved: {file_path}")
 
     def _generate_class_code(self, ir_class: IRClass, package: str, kind: str) -> tuple[str, set[str]]:
         imports = set()
@@ -25,7 +56,7 @@ class ControllerGenerator:
         for decorator in ir_class.decorators:
             if decorator.name == "Controller":
                 annotations.append("@RestController")
-                route = decorator.arguments.strip('"').strip("'") if decorator.arguments else ""
+                route = decorator.string_arg() or decorator.string_option("path") or ""
                 annotations.append(f'@RequestMapping("{route}")' if route else '@RequestMapping("")')
                 imports.update({
                     "org.springframework.web.bind.annotation.RestController",
@@ -104,17 +135,6 @@ class ControllerGenerator:
         lines.append("}")
         return "\n".join(lines), imports
 
-    def _save(self, java_code: str, class_name: str, kind: str, imports: set[str]):
-        path = self.base_output_dir / "src" / "main" / "java" / Path(*self.base_package.split(".")) / kind
-        path.mkdir(parents=True, exist_ok=True)
-        file_path = path / f"{class_name}.java"
-
-        java_code = self.import_optimizer.optimize(imports, java_code)
-
-        with open(file_path, "w") as f:
-            f.write(java_code)
-        print(f"✅ Saved: {file_path}")
-
     def _map_http_method(self, method_name: str) -> str:
         name = method_name.lower()
         if name.startswith("get"):
@@ -3,24 +3,39 @@
 from pathlib import Path
 from ir.ir_models import IRClass
 from utils.import_optimizer import ImportOptimizer
+from .fingerprint import JAVA_SOURCE_ROOT, property_signatures
 
 class DtoGenerator:
+    VERSION = "1"
+
     def __init__(self, base_package: str, base_output_dir: Path):
         self.base_package = base_package
         self.base_output_dir = base_output_dir
         self.import_optimizer = ImportOptimizer()
 
     def generate_and_save(self, ir_class: IRClass):
-        code = self.generate_dto_code(ir_class)
-        rel_path = Path(*self.base_package.split(".")) / "dto"
-        output_path = self.base_output_dir / "src" / "main" / "java" / rel_path
-        output_path.mkdir(parents=True, exist_ok=True)
+        outputs = self.render(ir_class)
+        self.save(outputs)
+        return outputs
+
+    def render(self, ir_class: IRClass) -> list[tuple[Path, str]]:
+        rel_path = Path(JAVA_SOURCE_ROOT, *self.base_package.split("."), "dto", f"{ir_class.name}.java")
+        return [(rel_path, self.generate_dto_code(ir_class))]
+
+    def fingerprint(self, ir_class: IRClass) -> list:
+        return [ir_class.name, property_signatures(ir_class)]
+
+    def cache_config(self) -> dict:
+        return {"base_package": self.base_package, "layout": JAVA_SOURCE_ROOT}
 
-        file_path = output_path / f"{ir_class.name}.java"
-        with open(file_path, "w") as f:
-            f.write(code)
+    def save(self, outputs: list[tuple[Path, str]]):
+        for rel_path, code in outputs:
+            file_path = self.base_output_dir / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "w") as f:
+                f.write(code)
 
-        print(f"✅ Saved DTO: {file_path.relative_to(self.base_output_dir)}")
+            print(f"✅ Saved DTO: {rel_path}")
 
     def generate_dto_code(self, ir_class: IRClass) -> str:
         # 1. Package line
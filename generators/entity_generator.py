@@ -4,23 +4,39 @@ from pathlib import Path
 from ir.ir_models import IRClass
 from utils.java_utils import to_snake_case
 from .type_mapper import map_ts_type_to_java
+from .fingerprint import JAVA_SOURCE_ROOT, property_signatures
 
 class EntityGenerator:
+    VERSION = "1"
+
     def __init__(self, base_package: str, base_output_dir: Path):
         self.base_package = base_package
         self.base_output_dir = base_output_dir
 
     def generate_and_save(self, ir_class):
+        outputs = self.render(ir_class)
+        self.save(outputs)
+        return outputs
+
+    def render(self, ir_class: IRClass) -> list[tuple[Path, str]]:
         package_path = self.base_package.replace(".", "/")
-        output_dir = self.base_output_dir / "src/main/java" / package_path / "entity"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        rel_path = Path(JAVA_SOURCE_ROOT) / package_path / "entity" / f"{ir_class.name}.java"
+        return [(rel_path, self._generate_entity_code(ir_class))]
+
+    def fingerprint(self, ir_class: IRClass) -> list:
+        return [ir_class.name, property_signatures(ir_class)]
+
+    def cache_config(self) -> dict:
+        return {"base_package": self.base_package, "layout": JAVA_SOURCE_ROOT}
 
-        class_code = self._generate_entity_code(ir_class)
-        file_path = output_dir / f"{ir_class.name}.java"
+    def save(self, outputs: list[tuple[Path, str]]):
+        for rel_path, class_code in outputs:
+            file_path = self.base_output_dir / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w") as f:
-            f.write(class_code)
-        print(f"✅ Saved: {file_path}")
+            with open(file_path, "w") as f:
+                f.write(class_code)
+            print(f"✅ Saved: {file_path}")
 
     def _generate_entity_code(self, ir_class: IRClass) -> str:
         class_name = ir_class.name
@@ -0,0 +1,27 @@
+# generators/fingerprint.py
+#
+# Helpers for generator fingerprints: plain, JSON-serializable views of the
+# IRClass fields a generator reads. Only touching the fields a generator uses
+# keeps lazily built members unbuilt.
+#
+# Each generator also carries a VERSION string that is part of its cache key;
+# bump it whenever a change to the generator alters the rendered Java.
+
+from ir.ir_models import IRClass
+
+JAVA_SOURCE_ROOT = "src/main/java"
+
+
+def decorator_signatures(decorators) -> list:
+    return [[d.name, d.arguments] for d in decorators]
+
+
+def property_signatures(ir_class: IRClass) -> list:
+    return [[p.name, p.type] for p in ir_class.properties]
+
+
+def method_signatures(ir_class: IRClass) -> list:
+    return [
+        [m.name, m.return_type, [[p.name, p.type] for p in m.parameters]]
+        for m in ir_class.methods
+    ]
@@ -0,0 +1,125 @@
+# generators/render_cache.py
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered Java, keyed by generator name, VERSION,
+    cache_config() and the generator's fingerprint of the IRClass.
+    Unchanged classes skip rendering entirely; their files are only
+    rewritten when missing from the output directory or edited since.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.restored = 0
+        self.evicted = 0
+        self.size_bytes: Optional[int] = None
+
+    def key(self, generator, ir_class) -> str:
+        payload = json.dumps(
+            [type(generator).__name__, generator.VERSION, generator.cache_config(), generator.fingerprint(ir_class)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def generate_and_save(self, generator, ir_class):
+        """Drop-in for generator.generate_and_save that consults the cache first."""
+        key = self.key(generator, ir_class)
+        outputs = self.get(key)
+        if outputs is not None:
+            self.hits += 1
+            stale = [(path, code) for path, code in outputs if not _on_disk(generator.base_output_dir / path, code)]
+            if stale:
+                self.restored += len(stale)
+                generator.save(stale)
+            else:
+                print(f"♻️  Up to date: {ir_class.name}")
+            return outputs
+
+        self.misses += 1
+        outputs = generator.render(ir_class)
+        generator.save(outputs)
+        self.put(key, outputs)
+        return outputs
+
+    def get(self, key: str) -> Optional[List[Tuple[Path, str]]]:
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Refresh mtime so eviction drops least recently used entries first
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return [(Path(path), code) for path, code in data["outputs"]]
+
+    def put(self, key: str, outputs: List[Tuple[Path, str]]):
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"outputs": [[Path(path).as_posix(), code] for path, code in outputs]}, f)
+        os.replace(tmp, entry)
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob("*/*.json"):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry))
+            total += st.st_size
+
+        evicted = 0
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self.evicted += evicted
+        self.size_bytes = total
+        return evicted
+
+    def report(self) -> str:
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0.0
+        size_str = f", {self.size_bytes / (1024 * 1024):.1f} MiB on disk" if self.size_bytes is not None else ""
+        return (
+            f"🗃️  Render cache: {self.hits} hit(s), {self.misses} miss(es) ({rate:.0f}% hit rate), "
+            f"{self.restored} missing or edited file(s) restored, {self.evicted} evicted{size_str}"
+        )
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+def _on_disk(path: Path, code: str) -> bool:
+    # Read back the way generators write (text mode, default encoding)
+    try:
+        with open(path, "r") as f:
+            return f.read() == code
+    except (OSError, UnicodeDecodeError):
+        return False
@@ -4,8 +4,11 @@ from pathlib import Path
 from ir.ir_models import IRClass
 from utils.file_utils import save_java_file
 from utils.import_optimizer import ImportOptimizer
+from .fingerprint import JAVA_SOURCE_ROOT
 
 class RepositoryGenerator:
+    VERSION = "1"
+
     def __init__(self, base_output_dir: Path, base_package: str):
         self.base_output_dir = base_output_dir
         self.base_package = base_package
@@ -13,9 +16,24 @@ class RepositoryGenerator:
 
     def generate_and_save(self, ir_class: IRClass):
         print(f"🛠️  Generating Repository: {ir_class.name}")
+        outputs = self.render(ir_class)
+        self.save(outputs)
+        return outputs
+
+    def render(self, ir_class: IRClass) -> list[tuple[Path, str]]:
         class_code = self._generate_repository_code(ir_class)
-        file_path = self._get_output_path(ir_class.name)
-        save_java_file(file_path, class_code)
+        return [(self._get_output_path(ir_class.name).relative_to(self.base_output_dir), class_code)]
+
+    def fingerprint(self, ir_class: IRClass) -> list:
+        # Only the class name drives the generated interface
+        return [ir_class.name]
+
+    def cache_config(self) -> dict:
+        return {"base_package": self.base_package, "layout": JAVA_SOURCE_ROOT}
+
+    def save(self, outputs: list[tuple[Path, str]]):
+        for rel_path, class_code in outputs:
+            save_java_file(self.base_output_dir / rel_path, class_code)
 
     def _generate_repository_code(self, ir_class: IRClass) -> str:
         if not ir_class.name.endswith("Repository"):
@@ -42,7 +60,7 @@ class RepositoryGenerator:
 
     def _get_output_path(self, class_name: str) -> Path:
         rel_path = Path(*self.base_package.split(".")) / "repository" / f"{class_name}.java"
-        return self.base_output_dir / "src" / "main" / "java" / rel_path
+        return self.base_output_dir / JAVA_SOURCE_ROOT / rel_path
 
     def _get_entity_import(self, entity_name: str) -> str:
         return f"{self.base_package}.entity.{entity_name}"
@@ -3,9 +3,12 @@ from ir.ir_models import IRClass
 from .type_mapper import map_ts_type_to_java
 from utils.import_optimizer import ImportOptimizer
 from utils.type_annotation_helper import TypeAnnotationHelper
+from .fingerprint import JAVA_SOURCE_ROOT, method_signatures
 
 
 class ServiceGenerator:
+    VERSION = "1"
+
     def __init__(self, base_package: str = "com.myapp.demo", base_output_dir: Path = Path("out")):
         self.base_package = base_package
         self.base_output_dir = base_output_dir
@@ -14,26 +17,31 @@ class ServiceGenerator:
 
     def generate_and_save(self, ir_class: IRClass):
         print("🧩 Generating service interface and implementation...")
-        self._save_interface(ir_class)
-        self._save_implementation(ir_class)
-
-    def _save_interface(self, ir_class: IRClass):
-        code = self._generate_interface(ir_class)
-        path = self._package_to_path("service")
-        path.mkdir(parents=True, exist_ok=True)
-        file_path = path / f"{ir_class.name}Service.java"
-        with open(file_path, "w") as f:
-            f.write(code)
-        print(f"✅ Interface saved: {file_path}")
-
-    def _save_implementation(self, ir_class: IRClass):
-        code = self._generate_implementation(ir_class)
-        path = self._package_to_path("service.impl")
-        path.mkdir(parents=True, exist_ok=True)
-        file_path = path / f"{ir_class.name}ServiceImpl.java"
-        with open(file_path, "w") as f:
-            f.write(code)
-        print(f"✅ Implementation saved: {file_path}")
+        outputs = self.render(ir_class)
+        self.save(outputs)
+        return outputs
+
+    def render(self, ir_class: IRClass) -> list[tuple[Path, str]]:
+        base = Path(JAVA_SOURCE_ROOT, *self.base_package.split("."), "service")
+        return [
+            (base / f"{ir_class.name}Service.java", self._generate_interface(ir_class)),
+            (base / "impl" / f"{ir_class.name}ServiceImpl.java", self._generate_implementation(ir_class)),
+        ]
+
+    def fingerprint(self, ir_class: IRClass) -> list:
+        return [ir_class.name, method_signatures(ir_class)]
+
+    def cache_config(self) -> dict:
+        return {"base_package": self.base_package, "layout": JAVA_SOURCE_ROOT}
+
+    def save(self, outputs: list[tuple[Path, str]]):
+        for rel_path, code in outputs:
+            file_path = self.base_output_dir / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "w") as f:
+                f.write(code)
+            label = "Implementation" if rel_path.stem.endswith("ServiceImpl") else "Interface"
+            print(f"✅ {label} saved: {file_path}")
 
     def _generate_interface(self, ir_class: IRClass) -> str:
         package = f"{self.base_package}.service"
@@ -106,7 +114,3 @@ class ServiceGenerator:
                 if java_type[0].isupper() and not java_type.startswith("List"):
                     dto_imports.add(f"{self.base_package}.dto.{java_type}")
         return dto_imports
-
-    def _package_to_path(self, sub_package: str) -> Path:
-        full_package = f"{self.base_package}.{sub_package}"
-        return self.base_output_dir / "src" / "main" / "java" / Path(*full_package.split("."))
@@ -0,0 +1,224 @@
+# decorator_parser.py
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+from .ir_models import IRDecorator, IRDecoratorArg
+
+# The same decorator texts (@Get(), @Body(), @Injectable()) repeat across a
+# codebase, so parsed results are memoized by raw text and shared.
+DECORATOR_CACHE_SIZE = 4096
+
+_LEADING_TRIVIA = re.compile(r"^(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_NAME = re.compile(r"@?\s*([A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)")
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*")
+_KEYWORDS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None), "undefined": ("null", None)}
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0"}
+_CLOSERS = {"(": ")", "[": "]", "{": "}"}
+
+
+@lru_cache(maxsize=DECORATOR_CACHE_SIZE)
+def parse_decorator(raw: str) -> IRDecorator:
+    """
+    Parse decorator source text such as "@Controller('users')" into a shared,
+    immutable IRDecorator with structured arguments.
+    """
+    text = _LEADING_TRIVIA.sub("", raw).rstrip()
+    match = _NAME.match(text)
+    if not match:
+        return IRDecorator(name=text.strip("@"))
+
+    name = match.group(1)
+    rest = text[match.end():].lstrip()
+    type_arguments = None
+    if rest.startswith("<"):
+        end = _type_arguments_end(rest)
+        type_arguments, rest = rest[:end], rest[end:].lstrip()
+    if not rest.startswith("(") or not rest.endswith(")"):
+        return IRDecorator(name=name)
+
+    arguments = rest[1:-1]
+    return IRDecorator(name=name, arguments=arguments, args=_ArgParser(arguments).parse_list(), type_arguments=type_arguments)
+
+
+def decorator_source(decorator: IRDecorator) -> str:
+    """Inverse of parse_decorator, minus any comments that preceded the decorator."""
+    if decorator.arguments is None:
+        return f"@{decorator.name}"
+    return f"@{decorator.name}{decorator.type_arguments or ''}({decorator.arguments})"
+
+
+def _type_arguments_end(text: str) -> int:
+    """Index just past the "<...>" that `text` starts with; "=>" inside does not close it."""
+    depth = 0
+    for i, ch in enumerate(text):
+        if ch == "<":
+            depth += 1
+        elif ch == ">" and text[i - 1] != "=":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(text)
+
+
+class _Fallback(Exception):
+    """Input is valid TypeScript but not a literal we model; keep it as raw text."""
+
+
+class _ArgParser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def parse_list(self, closer: str = "") -> Tuple[IRDecoratorArg, ...]:
+        items: List[IRDecoratorArg] = []
+        while True:
+            self._skip_ws()
+            if self._at_end(closer):
+                return tuple(items)
+            items.append(self._parse_value(closer))
+            self._skip_ws()
+            if self._peek() == ",":
+                self.pos += 1
+
+    def _parse_value(self, closer: str) -> IRDecoratorArg:
+        start = self.pos
+        try:
+            value = self._parse_literal()
+            self._skip_ws()
+            if not (self._peek() == "," or self._at_end(closer)):
+                raise _Fallback()
+            return value
+        except _Fallback:
+            # e.g. () => User, new ParseIntPipe(), a + b
+            self.pos = start
+            raw = self._scan_expression(closer)
+            return IRDecoratorArg("expression", raw, raw)
+
+    def _parse_literal(self) -> IRDecoratorArg:
+        start = self.pos
+        ch = self._peek()
+        if ch and ch in "'\"`":
+            value = self._parse_string()
+            return IRDecoratorArg("string", value, self.text[start:self.pos])
+        if ch == "{":
+            return self._parse_object()
+        if ch == "[":
+            self.pos += 1
+            items = self.parse_list("]")
+            self._expect("]")
+            return IRDecoratorArg("array", items, self.text[start:self.pos])
+
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            number = match.group()
+            value = float(number) if any(c in number for c in ".eE") else int(number)
+            return IRDecoratorArg("number", value, number)
+
+        match = _IDENTIFIER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            word = match.group()
+            kind, value = _KEYWORDS.get(word, ("identifier", word))
+            return IRDecoratorArg(kind, value, word)
+        raise _Fallback()
+
+    def _parse_object(self) -> IRDecoratorArg:
+        start = self.pos
+        self.pos += 1
+        entries = []
+        while True:
+            self._skip_ws()
+            if self._peek() == "}":
+                self.pos += 1
+                return IRDecoratorArg("object", tuple(entries), self.text[start:self.pos])
+            if not self._peek():
+                raise _Fallback()
+            if self._peek() in "'\"":
+                key = self._parse_string()
+            else:
+                match = _IDENTIFIER.match(self.text, self.pos)
+                # Computed keys, spreads and methods are not modelled
+                if not match or "." in match.group():
+                    raise _Fallback()
+                key = match.group()
+                self.pos = match.end()
+            self._skip_ws()
+            if self._peek() == ":":
+                self.pos += 1
+                self._skip_ws()
+                value = self._parse_value("}")
+            elif self._peek() in ",}":
+                # Shorthand property: { email }
+                value = IRDecoratorArg("identifier", key, key)
+            else:
+                raise _Fallback()
+            entries.append((key, value))
+            self._skip_ws()
+            if self._peek() == ",":
+                self.pos += 1
+
+    def _parse_string(self) -> str:
+        quote = self._peek()
+        self.pos += 1
+        chars = []
+        while self.pos < len(self.text):
+            ch = self.text[self.pos]
+            if ch == "\\" and self.pos + 1 < len(self.text):
+                nxt = self.text[self.pos + 1]
+                chars.append(_ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            if ch == quote:
+                self.pos += 1
+                return "".join(chars)
+            if quote == "`" and self.text.startswith("${", self.pos):
+                raise _Fallback()
+            chars.append(ch)
+            self.pos += 1
+        raise _Fallback()
+
+    def _skip_string(self):
+        quote = self._peek()
+        self.pos += 1
+        while self.pos < len(self.text):
+            ch = self.text[self.pos]
+            self.pos += 2 if ch == "\\" else 1
+            if ch == quote:
+                return
+
+    def _scan_expression(self, closer: str) -> str:
+        """Consume raw text up to the next top-level comma or `closer`."""
+        start = self.pos
+        stack = []
+        while self.pos < len(self.text):
+            ch = self.text[self.pos]
+            if ch in "'\"`":
+                self._skip_string()
+                continue
+            if not stack and (ch == "," or (closer and ch == closer)):
+                break
+            if ch in _CLOSERS:
+                stack.append(_CLOSERS[ch])
+            elif stack and ch == stack[-1]:
+                stack.pop()
+            self.pos += 1
+        return self.text[start:self.pos].strip()
+
+    def _expect(self, ch: str):
+        if self._peek() != ch:
+            raise _Fallback()
+        self.pos += 1
+
+    def _skip_ws(self):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def _peek(self) -> str:
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def _at_end(self, closer: str) -> bool:
+        return self.pos >= len(self.text) or (bool(closer) and self._peek() == closer)
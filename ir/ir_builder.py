@@ -1,18 +1,104 @@
 # ir_builder.py
 
 import json
-from typing import List
+from dataclasses import fields
+from typing import Iterator, List, Optional
 from .ir_models import IRClass, IRProperty, IRMethod, IRParam, IRDecorator
+from .decorator_parser import parse_decorator
 
 def parse_decorator_string(deco: str) -> IRDecorator:
-    if '(' in deco:
-        name = deco.split('(')[0].strip('@')
-        args = deco[len(name)+2:-1]
-        return IRDecorator(name=name, arguments=args)
-    else:
-        return IRDecorator(name=deco.strip('@'))
+    # Memoized: identical decorator texts share one immutable IRDecorator
+    return parse_decorator(deco)
+
+def build_properties(cls: dict) -> List[IRProperty]:
+    return [
+        IRProperty(
+            name=p['name'],
+            type=p['type'],
+            access_modifier=p.get('access'),
+            is_readonly=p.get('isReadonly', False),
+            decorators=[parse_decorator_string(d) for d in p.get('decorators', [])]
+        )
+        for p in cls.get('properties', [])
+    ]
+
+def build_constructor_params(cls: dict) -> List[IRParam]:
+    return [
+        IRParam(
+            name=param['name'],
+            type=param['type'],
+            decorators=[parse_decorator_string(d) for d in param.get('decorators', [])]
+        )
+        for param in cls.get('constructorParams', [])
+    ]
+
+def build_methods(cls: dict) -> List[IRMethod]:
+    return [
+        IRMethod(
+            name=m['name'],
+            return_type=m['returnType'],
+            decorators=[parse_decorator_string(d) for d in m.get('decorators', [])],
+            parameters=[
+                IRParam(
+                    name=p['name'],
+                    type=p['type'],
+                    decorators=[parse_decorator_string(d) for d in p.get('decorators', [])]
+                )
+                for p in m.get('parameters', [])
+            ]
+        )
+        for m in cls.get('methods', [])
+    ]
+
+_MEMBER_BUILDERS = {
+    "properties": build_properties,
+    "constructor_params": build_constructor_params,
+    "methods": build_methods,
+}
+
+class LazyIRClass(IRClass):
+    """
+    IRClass that keeps its raw bridge record and builds properties,
+    constructor_params and methods only when first read. Classification and
+    generators that never touch members (e.g. repositories) skip that work.
+    """
+
+    def __init__(self, cls: dict, source_file: Optional[str] = None):
+        # Deliberately not calling IRClass.__init__: member fields stay unset
+        # until __getattr__ builds them.
+        self.name = cls['name']
+        self.decorators = [parse_decorator_string(d) for d in cls.get('decorators', [])]
+        self.extends = cls.get('extends')
+        self.implements = cls.get('implements', [])
+        self.source_file = source_file
+        self._record = cls
+
+    def __getattr__(self, attr):
+        builder = _MEMBER_BUILDERS.get(attr)
+        if builder is None or "_record" not in self.__dict__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {attr!r}")
+        value = builder(self._record)
+        setattr(self, attr, value)
+        if all(name in self.__dict__ for name in _MEMBER_BUILDERS):
+            del self._record
+        return value
+
+    # Compare and print like a plain IRClass, so callers can't tell the difference
+    def __eq__(self, other):
+        if not isinstance(other, IRClass):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(IRClass))
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in fields(IRClass) if f.repr)
+        return f"IRClass({values})"
+
+def build_ir_from_json(json_data: List[dict], source_file: Optional[str] = None, lazy: bool = False) -> List[IRClass]:
+    if lazy:
+        return [LazyIRClass(cls, source_file=source_file) for cls in json_data]
 
-def build_ir_from_json(json_data: List[dict]) -> List[IRClass]:
     classes = []
 
     for cls in json_data:
@@ -21,47 +107,51 @@ def build_ir_from_json(json_data: List[dict]) -> List[IRClass]:
             decorators=[parse_decorator_string(d) for d in cls.get('decorators', [])],
             extends=cls.get('extends'),
             implements=cls.get('implements', []),
-            properties=[
-                IRProperty(
-                    name=p['name'],
-                    type=p['type'],
-                    access_modifier=p.get('access'),
-                    is_readonly=p.get('isReadonly', False),
-                    decorators=[parse_decorator_string(d) for d in p.get('decorators', [])]
-                )
-                for p in cls.get('properties', [])
-            ],
-            constructor_params=[
-                IRParam(
-                    name=param['name'],
-                    type=param['type'],
-                    decorators=param.get('decorators', [])
-                )
-                for param in cls.get('constructorParams', [])
-            ],
-            methods=[
-                IRMethod(
-                    name=m['name'],
-                    return_type=m['returnType'],
-                    decorators=[parse_decorator_string(d) for d in m.get('decorators', [])],
-                    parameters=[
-                        IRParam(
-                            name=p['name'],
-                            type=p['type'],
-                            decorators=p.get('decorators', [])
-                        )
-                        for p in m.get('parameters', [])
-                    ]
-                )
-                for m in cls.get('methods', [])
-            ]
+            properties=build_properties(cls),
+            constructor_params=build_constructor_params(cls),
+            methods=build_methods(cls),
+            source_file=source_file
         )
 
         classes.append(ir_class)
 
     return classes
 
-def load_ir_from_file(json_file_path: str) -> List[IRClass]:
-    with open(json_file_path, 'r') as f:
-        data = json.load(f)
-    return build_ir_from_json(data)
+def detect_ir_format(path: str) -> str:
+    if path.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if path.endswith(('.msgpack', '.mpk')):
+        return 'msgpack'
+    return 'json'
+
+def iter_ir_from_file(path: str, fmt: Optional[str] = None, lazy: bool = False) -> Iterator[IRClass]:
+    """
+    Stream IR classes from a bridge AST dump or an IR snapshot written by
+    IRWriter (json, ndjson or msgpack). ndjson and msgpack are read one
+    record at a time.
+    """
+    fmt = fmt or detect_ir_format(path)
+    if fmt == 'ndjson':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield _build_record(json.loads(line), lazy)
+    elif fmt == 'msgpack':
+        try:
+            import msgpack
+        except ImportError as exc:
+            raise RuntimeError("Reading msgpack IR requires the 'msgpack' package (pip install msgpack)") from exc
+        with open(path, 'rb') as f:
+            for record in msgpack.Unpacker(f, raw=False):
+                yield _build_record(record, lazy)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for record in data:
+            yield _build_record(record, lazy)
+
+def load_ir_from_file(json_file_path: str, fmt: Optional[str] = None, lazy: bool = False) -> List[IRClass]:
+    return list(iter_ir_from_file(json_file_path, fmt=fmt, lazy=lazy))
+
+def _build_record(record: dict, lazy: bool) -> IRClass:
+    return build_ir_from_json([record], source_file=record.get('sourceFile'), lazy=lazy)[0]
@@ -0,0 +1,114 @@
+# ir/ir_dedup.py
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from .decorator_parser import decorator_source, parse_decorator
+from .ir_builder import LazyIRClass
+from .ir_models import IRClass, IRParam
+
+
+def semantic_hash(ir_class: IRClass) -> str:
+    """
+    Hash of everything that affects generation: the IR fields minus
+    source_file. Decorators are compared by their normalized source, so doc
+    comments and other trivia don't count, and bridge fields the IR doesn't
+    carry (e.g. isStatic) are ignored. Lazy, eager and store-loaded classes
+    that compare equal hash equal.
+    """
+    members = _member_records(ir_class)
+    view = {
+        "name": ir_class.name,
+        "decorators": [decorator_source(d) for d in ir_class.decorators],
+        "extends": ir_class.extends,
+        "implements": list(ir_class.implements),
+        "properties": [
+            [p["name"], p["type"], p.get("access"), p.get("isReadonly", False), _decorators(p)]
+            for p in members.get("properties", [])
+        ],
+        "constructorParams": [_param(p) for p in members.get("constructorParams", [])],
+        "methods": [
+            [m["name"], m["returnType"], _decorators(m), [_param(p) for p in m.get("parameters", [])]]
+            for m in members.get("methods", [])
+        ],
+    }
+    payload = json.dumps(view, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _member_records(ir_class: IRClass) -> dict:
+    # An unbuilt LazyIRClass is read from its bridge record, so members are
+    # not materialized just to be compared; anything else is viewed the same way
+    record = ir_class.__dict__.get("_record") if isinstance(ir_class, LazyIRClass) else None
+    if record is not None:
+        return record
+    return {
+        "properties": [
+            {"name": p.name, "type": p.type, "access": p.access_modifier,
+             "isReadonly": p.is_readonly, "decorators": p.decorators}
+            for p in ir_class.properties
+        ],
+        "constructorParams": [_param_record(p) for p in ir_class.constructor_params],
+        "methods": [
+            {"name": m.name, "returnType": m.return_type, "decorators": m.decorators,
+             "parameters": [_param_record(p) for p in m.parameters]}
+            for m in ir_class.methods
+        ],
+    }
+
+
+def _param_record(param: IRParam) -> dict:
+    return {"name": param.name, "type": param.type, "decorators": param.decorators}
+
+
+def _param(record: dict) -> list:
+    return [record["name"], record["type"], _decorators(record)]
+
+
+def _decorators(record: dict) -> list:
+    # Raw bridge text goes through the (memoized) parser to drop leading trivia
+    return [
+        decorator_source(parse_decorator(d) if isinstance(d, str) else d)
+        for d in record.get("decorators", [])
+    ]
+
+
+class ClassDeduplicator:
+    """
+    Tracks classes by name and semantic hash. A copy identical to one already
+    seen is a duplicate; same name with a different body is a collision.
+    """
+
+    def __init__(self):
+        # name -> semantic hash -> source files carrying that body
+        self._seen: Dict[str, Dict[str, List[Optional[str]]]] = {}
+        self.duplicates = 0
+
+    def first_seen(self, ir_class: IRClass, digest: Optional[str] = None) -> bool:
+        variants = self._seen.setdefault(ir_class.name, {})
+        digest = digest or semantic_hash(ir_class)
+        sources = variants.get(digest)
+        if sources is not None:
+            sources.append(ir_class.source_file)
+            self.duplicates += 1
+            return False
+        variants[digest] = [ir_class.source_file]
+        return True
+
+    def remember(self, name: str, digest: str, source_file: Optional[str]):
+        """Register a class generated by an earlier run (e.g. a file --resume skips)."""
+        self._seen.setdefault(name, {}).setdefault(digest, []).append(source_file)
+
+    def collisions(self) -> Dict[str, List[List[Optional[str]]]]:
+        return {name: list(variants.values()) for name, variants in self._seen.items() if len(variants) > 1}
+
+    def report(self) -> List[str]:
+        lines = []
+        if self.duplicates:
+            lines.append(f"🧬 Skipped {self.duplicates} identical duplicate class(es)")
+        for name, variants in sorted(self.collisions().items()):
+            lines.append(f"⚠️  {name} has {len(variants)} different definitions:")
+            for sources in variants:
+                lines.append(f"   - {', '.join(str(s) for s in sources)}")
+        return lines
@@ -1,18 +1,42 @@
 # ir_models.py
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-@dataclass
+@dataclass(frozen=True)
+class IRDecoratorArg:
+    kind: str  # string | number | boolean | null | identifier | object | array | expression
+    value: Any  # object: tuple of (key, IRDecoratorArg); array: tuple of IRDecoratorArg
+    raw: str
+
+@dataclass(frozen=True)
 class IRDecorator:
     name: str
-    arguments: Optional[str] = None  # e.g., "@Controller('users')"
+    arguments: Optional[str] = None  # raw argument text, e.g. "'users'" for @Controller('users')
+    args: Tuple[IRDecoratorArg, ...] = ()
+    type_arguments: Optional[str] = None  # e.g. "<User>" for @Type<User>()
+
+    def string_arg(self, index: int = 0) -> Optional[str]:
+        if index < len(self.args) and self.args[index].kind == "string":
+            return self.args[index].value
+        return None
+
+    def option(self, key: str) -> Optional[IRDecoratorArg]:
+        """Look up `key` in the first object-literal argument, e.g. @Controller({ path: 'users' })."""
+        for arg in self.args:
+            if arg.kind == "object":
+                return next((value for k, value in arg.value if k == key), None)
+        return None
+
+    def string_option(self, key: str) -> Optional[str]:
+        value = self.option(key)
+        return value.value if value is not None and value.kind == "string" else None
 
 @dataclass
 class IRParam:
     name: str
     type: str
-    decorators: List[str] = field(default_factory=list)
+    decorators: List[IRDecorator] = field(default_factory=list)
 
 @dataclass
 class IRMethod:
@@ -38,3 +62,4 @@ class IRClass:
     properties: List[IRProperty] = field(default_factory=list)
     constructor_params: List[IRParam] = field(default_factory=list)
     methods: List[IRMethod] = field(default_factory=list)
+    source_file: Optional[str] = None
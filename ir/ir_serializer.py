@@ -0,0 +1,143 @@
+# ir_serializer.py
+
+import json
+from typing import BinaryIO, List, TextIO, Union
+
+from .decorator_parser import decorator_source
+from .ir_models import IRClass, IRDecorator, IRParam
+
+IR_FORMATS = ["json", "ndjson", "msgpack"]
+
+# Records use the same camelCase schema the ts-morph bridge emits (plus
+# "sourceFile"), so snapshots load back through build_ir_from_json.
+_str = json.JSONEncoder(ensure_ascii=False).encode
+
+
+class IRWriter:
+    """
+    Stream IRClass objects to a file one class at a time. Each class is
+    encoded straight from the dataclass fields; no intermediate dicts are built.
+    """
+
+    def __init__(self, stream: Union[TextIO, BinaryIO], fmt: str = "json"):
+        if fmt not in IR_FORMATS:
+            raise ValueError(f"Unsupported IR format: {fmt} (expected one of {', '.join(IR_FORMATS)})")
+        self.stream = stream
+        self.fmt = fmt
+        self.count = 0
+        self._packer = _msgpack_packer() if fmt == "msgpack" else None
+
+    def write(self, ir_class: IRClass):
+        if self.fmt == "msgpack":
+            _pack_class(self._packer, self.stream, ir_class)
+        elif self.fmt == "ndjson":
+            self.stream.write(_encode_class(ir_class))
+            self.stream.write("\n")
+        else:
+            self.stream.write("[\n" if self.count == 0 else ",\n")
+            self.stream.write(_encode_class(ir_class))
+        self.count += 1
+
+    def close(self):
+        if self.fmt == "json":
+            self.stream.write("\n]\n" if self.count else "[]\n")
+        self.stream.flush()
+
+
+# ---- JSON ----------------------------------------------------------------
+
+def _encode_class(c: IRClass) -> str:
+    return "".join((
+        '{"name":', _str(c.name),
+        ',"decorators":', _encode_decorators(c.decorators),
+        ',"extends":', _str(c.extends),
+        ',"implements":', _str(c.implements),
+        ',"properties":[', ",".join(
+            "".join((
+                '{"name":', _str(p.name),
+                ',"type":', _str(p.type),
+                ',"access":', _str(p.access_modifier),
+                ',"isReadonly":', "true" if p.is_readonly else "false",
+                ',"decorators":', _encode_decorators(p.decorators), "}",
+            ))
+            for p in c.properties
+        ),
+        '],"constructorParams":', _encode_params(c.constructor_params),
+        ',"methods":[', ",".join(
+            "".join((
+                '{"name":', _str(m.name),
+                ',"returnType":', _str(m.return_type),
+                ',"decorators":', _encode_decorators(m.decorators),
+                ',"parameters":', _encode_params(m.parameters), "}",
+            ))
+            for m in c.methods
+        ),
+        '],"sourceFile":', _str(c.source_file), "}",
+    ))
+
+
+def _encode_params(params: List[IRParam]) -> str:
+    return "[" + ",".join(
+        '{"name":' + _str(p.name) + ',"type":' + _str(p.type) + ',"decorators":' + _encode_decorators(p.decorators) + "}"
+        for p in params
+    ) + "]"
+
+
+def _encode_decorators(decorators: List[IRDecorator]) -> str:
+    return "[" + ",".join(_str(decorator_source(d)) for d in decorators) + "]"
+
+
+# ---- MessagePack ---------------------------------------------------------
+
+def _msgpack_packer():
+    try:
+        import msgpack
+    except ImportError as exc:
+        raise RuntimeError("msgpack output requires the 'msgpack' package (pip install msgpack)") from exc
+    return msgpack.Packer(use_bin_type=True)
+
+
+def _pack_class(packer, out: BinaryIO, c: IRClass):
+    out.write(packer.pack_map_header(8))
+    out.write(packer.pack("name") + packer.pack(c.name))
+    _pack_decorators(packer, out, c.decorators)
+    out.write(packer.pack("extends") + packer.pack(c.extends))
+    out.write(packer.pack("implements") + packer.pack(c.implements))
+
+    out.write(packer.pack("properties") + packer.pack_array_header(len(c.properties)))
+    for p in c.properties:
+        out.write(packer.pack_map_header(5))
+        out.write(packer.pack("name") + packer.pack(p.name))
+        out.write(packer.pack("type") + packer.pack(p.type))
+        out.write(packer.pack("access") + packer.pack(p.access_modifier))
+        out.write(packer.pack("isReadonly") + packer.pack(p.is_readonly))
+        _pack_decorators(packer, out, p.decorators)
+
+    out.write(packer.pack("constructorParams"))
+    _pack_params(packer, out, c.constructor_params)
+
+    out.write(packer.pack("methods") + packer.pack_array_header(len(c.methods)))
+    for m in c.methods:
+        out.write(packer.pack_map_header(4))
+        out.write(packer.pack("name") + packer.pack(m.name))
+        out.write(packer.pack("returnType") + packer.pack(m.return_type))
+        _pack_decorators(packer, out, m.decorators)
+        out.write(packer.pack("parameters"))
+        _pack_params(packer, out, m.parameters)
+
+    out.write(packer.pack("sourceFile") + packer.pack(c.source_file))
+
+
+def _pack_params(packer, out: BinaryIO, params: List[IRParam]):
+    out.write(packer.pack_array_header(len(params)))
+    for p in params:
+        out.write(packer.pack_map_header(3))
+        out.write(packer.pack("name") + packer.pack(p.name))
+        out.write(packer.pack("type") + packer.pack(p.type))
+        _pack_decorators(packer, out, p.decorators)
+
+
+def _pack_decorators(packer, out: BinaryIO, decorators: List[IRDecorator]):
+    out.write(packer.pack("decorators") + packer.pack_array_header(len(decorators)))
+    for d in decorators:
+        out.write(packer.pack(decorator_source(d)))
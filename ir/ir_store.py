@@ -0,0 +1,282 @@
+# ir_store.py
+
+import json
+import sqlite3
+from typing import Iterable, Iterator, List, Optional
+
+from detectors.kind_detector import detect_kind
+from .decorator_parser import decorator_source
+from .ir_builder import parse_decorator_string
+from .ir_models import IRClass, IRProperty, IRMethod, IRParam, IRDecorator
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_files (
+    path      TEXT PRIMARY KEY,
+    mtime_ns  INTEGER NOT NULL,
+    size      INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS classes (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    kind        TEXT,
+    route       TEXT,
+    source_file TEXT,
+    extends     TEXT,
+    implements  TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_classes_kind ON classes(kind);
+CREATE INDEX IF NOT EXISTS idx_classes_name ON classes(name);
+CREATE INDEX IF NOT EXISTS idx_classes_source_file ON classes(source_file);
+
+-- member_kind: property | constructor_param | method | parameter (parent_id -> method)
+CREATE TABLE IF NOT EXISTS members (
+    id              INTEGER PRIMARY KEY,
+    class_id        INTEGER NOT NULL REFERENCES classes(id) ON DELETE CASCADE,
+    parent_id       INTEGER REFERENCES members(id) ON DELETE CASCADE,
+    member_kind     TEXT NOT NULL,
+    position        INTEGER NOT NULL,
+    name            TEXT NOT NULL,
+    type            TEXT,
+    access_modifier TEXT,
+    is_readonly     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_members_class ON members(class_id);
+
+-- member_id is NULL for class-level decorators
+CREATE TABLE IF NOT EXISTS decorators (
+    id        INTEGER PRIMARY KEY,
+    class_id  INTEGER NOT NULL REFERENCES classes(id) ON DELETE CASCADE,
+    member_id INTEGER REFERENCES members(id) ON DELETE CASCADE,
+    position  INTEGER NOT NULL,
+    raw       TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    arguments TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_decorators_class ON decorators(class_id);
+CREATE INDEX IF NOT EXISTS idx_decorators_name ON decorators(name);
+"""
+
+
+class IRStore:
+    """
+    SQLite-backed store for IR classes, so large projects don't need every
+    IRClass in memory between parsing and generation. Rows are keyed by
+    source file, which lets later runs replace only the files that changed.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- incremental updates -------------------------------------------
+
+    def is_current(self, path: str, mtime_ns: int, size: int) -> bool:
+        row = self.conn.execute(
+            "SELECT mtime_ns, size FROM source_files WHERE path = ?", (path,)
+        ).fetchone()
+        return row is not None and row == (mtime_ns, size)
+
+    def replace_file(self, path: str, classes: Iterable[IRClass], mtime_ns: int, size: int):
+        """Atomically swap all rows that came from `path` for `classes`."""
+        with self.conn:
+            self.conn.execute("DELETE FROM classes WHERE source_file = ?", (path,))
+            for ir_class in classes:
+                self._insert_class(ir_class, path)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO source_files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (path, mtime_ns, size),
+            )
+
+    def forget(self, path: str):
+        """Drop rows for `path` and mark it unparsed, so the next run re-parses it."""
+        with self.conn:
+            self.conn.execute("DELETE FROM classes WHERE source_file = ?", (path,))
+            self.conn.execute("DELETE FROM source_files WHERE path = ?", (path,))
+
+    def prune(self, keep_paths: Iterable[str]) -> int:
+        """Drop rows for source files that are no longer part of the input set."""
+        keep = set(keep_paths)
+        stale = [p for (p,) in self.conn.execute("SELECT path FROM source_files") if p not in keep]
+        for path in stale:
+            self.forget(path)
+        return len(stale)
+
+    def _insert_class(self, ir_class: IRClass, source_file: str):
+        cur = self.conn.execute(
+            "INSERT INTO classes (name, kind, route, source_file, extends, implements) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                ir_class.name,
+                detect_kind(ir_class),
+                _controller_route(ir_class),
+                source_file,
+                ir_class.extends,
+                json.dumps(ir_class.implements),
+            ),
+        )
+        class_id = cur.lastrowid
+        self._insert_decorators(class_id, None, ir_class.decorators)
+
+        for pos, prop in enumerate(ir_class.properties):
+            member_id = self._insert_member(
+                class_id, None, "property", pos, prop.name, prop.type, prop.access_modifier, prop.is_readonly
+            )
+            self._insert_decorators(class_id, member_id, prop.decorators)
+
+        for pos, param in enumerate(ir_class.constructor_params):
+            member_id = self._insert_member(class_id, None, "constructor_param", pos, param.name, param.type)
+            self._insert_decorators(class_id, member_id, param.decorators)
+
+        for pos, method in enumerate(ir_class.methods):
+            method_id = self._insert_member(class_id, None, "method", pos, method.name, method.return_type)
+            self._insert_decorators(class_id, method_id, method.decorators)
+            for param_pos, param in enumerate(method.parameters):
+                member_id = self._insert_member(class_id, method_id, "parameter", param_pos, param.name, param.type)
+                self._insert_decorators(class_id, member_id, param.decorators)
+
+    def _insert_member(self, class_id, parent_id, member_kind, position, name, type_,
+                       access_modifier=None, is_readonly=False) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO members (class_id, parent_id, member_kind, position, name, type, access_modifier, is_readonly)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (class_id, parent_id, member_kind, position, name, type_, access_modifier, int(is_readonly)),
+        )
+        return cur.lastrowid
+
+    def _insert_decorators(self, class_id: int, member_id: Optional[int], decorators: List[IRDecorator]):
+        self.conn.executemany(
+            "INSERT INTO decorators (class_id, member_id, position, raw, name, arguments) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (class_id, member_id, pos, decorator_source(d), d.name, d.arguments)
+                for pos, d in enumerate(decorators)
+            ],
+        )
+
+    # ---- queries ---------------------------------------------------------
+
+    def kinds(self) -> List[Optional[str]]:
+        return [kind for (kind,) in self.conn.execute("SELECT DISTINCT kind FROM classes ORDER BY kind")]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM classes").fetchone()[0]
+
+    def iter_batches(self, kind: Optional[str] = None, batch_size: int = 200, **filters) -> Iterator[List[IRClass]]:
+        """
+        Yield classes of one kind in batches of at most `batch_size`, so only
+        one batch is materialized at a time. `kind=None` selects unclassified rows.
+        """
+        sql, params = self._select_ids(**filters)
+        sql += " AND kind IS ? ORDER BY id"
+        ids = [row_id for (row_id,) in self.conn.execute(sql, params + [kind])]
+        for start in range(0, len(ids), batch_size):
+            yield self._load(ids[start:start + batch_size])
+
+    def query(self, kind: Optional[str] = None, name: Optional[str] = None,
+              route_prefix: Optional[str] = None, source_file: Optional[str] = None) -> Iterator[IRClass]:
+        sql, params = self._select_ids(name=name, route_prefix=route_prefix, source_file=source_file)
+        if kind is not None:
+            sql += " AND kind = ?"
+            params.append(kind)
+        ids = [row_id for (row_id,) in self.conn.execute(sql + " ORDER BY id", params)]
+        for start in range(0, len(ids), 200):
+            yield from self._load(ids[start:start + 200])
+
+    def _select_ids(self, name: Optional[str] = None, route_prefix: Optional[str] = None,
+                    source_file: Optional[str] = None):
+        sql = "SELECT id FROM classes WHERE 1 = 1"
+        params: list = []
+        if name is not None:
+            sql += " AND name = ?"
+            params.append(name)
+        if route_prefix is not None:
+            prefix = _normalize_route(route_prefix)
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " AND route LIKE ? ESCAPE '\\'"
+            params.append(escaped + "%")
+        if source_file is not None:
+            sql += " AND source_file = ?"
+            params.append(source_file)
+        return sql, params
+
+    def _load(self, ids: List[int]) -> List[IRClass]:
+        if not ids:
+            return []
+        marks = ",".join("?" * len(ids))
+
+        decorators = {}
+        for class_id, member_id, raw, name, arguments in self.conn.execute(
+            f"SELECT class_id, member_id, raw, name, arguments FROM decorators"
+            f" WHERE class_id IN ({marks}) ORDER BY position", ids
+        ):
+            decorators.setdefault((class_id, member_id), []).append((raw, name, arguments))
+
+        classes = {}
+        for class_id, name, source_file, extends, implements in self.conn.execute(
+            f"SELECT id, name, source_file, extends, implements FROM classes WHERE id IN ({marks})", ids
+        ):
+            classes[class_id] = IRClass(
+                name=name,
+                decorators=_decorators(decorators.get((class_id, None), [])),
+                extends=extends,
+                implements=json.loads(implements),
+                source_file=source_file,
+            )
+
+        methods = {}
+        for row in self.conn.execute(
+            f"SELECT id, class_id, parent_id, member_kind, name, type, access_modifier, is_readonly"
+            f" FROM members WHERE class_id IN ({marks}) ORDER BY parent_id IS NOT NULL, position", ids
+        ):
+            member_id, class_id, parent_id, member_kind, name, type_, access_modifier, is_readonly = row
+            ir_class = classes[class_id]
+            member_decorators = decorators.get((class_id, member_id), [])
+            if member_kind == "property":
+                ir_class.properties.append(IRProperty(
+                    name=name,
+                    type=type_,
+                    access_modifier=access_modifier,
+                    is_readonly=bool(is_readonly),
+                    decorators=_decorators(member_decorators),
+                ))
+            elif member_kind == "constructor_param":
+                ir_class.constructor_params.append(
+                    IRParam(name=name, type=type_, decorators=_decorators(member_decorators))
+                )
+            elif member_kind == "method":
+                method = IRMethod(name=name, return_type=type_, decorators=_decorators(member_decorators))
+                methods[member_id] = method
+                ir_class.methods.append(method)
+            elif member_kind == "parameter":
+                methods[parent_id].parameters.append(
+                    IRParam(name=name, type=type_, decorators=_decorators(member_decorators))
+                )
+
+        return [classes[class_id] for class_id in ids if class_id in classes]
+
+
+def _decorators(rows) -> List[IRDecorator]:
+    # Re-parse from raw text: goes through the decorator cache and restores structured args
+    return [parse_decorator_string(raw) for raw, _, _ in rows]
+
+
+def _controller_route(ir_class: IRClass) -> Optional[str]:
+    for decorator in ir_class.decorators:
+        if decorator.name == "Controller":
+            return _normalize_route(decorator.string_arg() or decorator.string_option("path") or "")
+    return None
+
+
+def _normalize_route(route: str) -> str:
+    return route.strip().strip('"').strip("'").strip("`").strip("/")
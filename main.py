@@ -2,127 +2,463 @@
 
 import os
 import argparse
-import json
-import subprocess
+import asyncio
+import contextlib
+import functools
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from ir.ir_builder import build_ir_from_json
+from typing import Optional
+from ir.ir_builder import build_ir_from_json, iter_ir_from_file
+from ir.ir_dedup import ClassDeduplicator, semantic_hash
+from ir.ir_serializer import IR_FORMATS, IRWriter
+from ir.ir_store import IRStore
 from generators.controller_generator import ControllerGenerator
 from generators.service_generator import ServiceGenerator
 from generators.dto_generator import DtoGenerator
 from generators.entity_generator import EntityGenerator
-from detectors.repository_detector import is_repository_class
+from detectors.kind_detector import JAVA_KINDS, detect_kind
+from detectors.prescan import PrescanIndex
 from generators.repository_generator import RepositoryGenerator
+from generators.render_cache import DEFAULT_MAX_BYTES, RenderCache
 
 
 from scaffolder.gradle_scaffolder import scaffold_gradle_project
+from ts_parser.async_runner import iter_parse_results
+from utils.batch_config import BatchConfigError, load_batch_config
+from utils.run_journal import RunJournal
+from utils.source_discovery import DEFAULT_EXCLUDED_DIRS, SourceDiscovery
 
-TS_PARSER_PATH = Path("ts_parser/ts_morph_bridge.js")
+DEFAULT_PARSE_CONCURRENCY = os.cpu_count() or 4
 
-def parse_typescript_file(ts_file: str) -> list:
-    """Parse a single TypeScript file or pre-parsed JSON."""
-    if ts_file.endswith(".json"):
-        with open(ts_file, "r") as f:
-            return json.load(f)
+KIND_LABELS = {
+    "controller": "Controller",
+    "repository": "Repository",
+    "service": "Service",
+    "dto": "DTO",
+    "entity": "Entity",
+}
+
+@dataclass
+class SharedState:
+    """Warm state reused by every target of a --config batch run."""
+    render_cache: Optional[RenderCache] = None
+    prescan_index: Optional[PrescanIndex] = None
+    parse_slots: Optional[asyncio.Semaphore] = None
+
+def build_java_generators(output_dir: Path, package: str) -> dict:
+    return {
+        "controller": ControllerGenerator(base_package=package, base_output_dir=output_dir),
+        "service": ServiceGenerator(base_package=package, base_output_dir=output_dir),
+        "dto": DtoGenerator(base_package=package, base_output_dir=output_dir),
+        "entity": EntityGenerator(base_package=package, base_output_dir=output_dir),
+        "repository": RepositoryGenerator(output_dir, package),
+    }
+
+def generate_java(ir_class, generators: dict, render_cache: Optional[RenderCache] = None) -> list:
+    """Generate Java for one class; returns (file path, code) for every file written."""
+    print("🔍 Debug IRClass:", ir_class.name)
+    # print("    Base classes:", ir_class.base_classes)
+    print("    Decorators:", [d.name for d in ir_class.decorators])
+
+    decorator_names = [d.name.lower() for d in ir_class.decorators]
+    print(f"📦 Scanning: {ir_class.name}, decorators={decorator_names}")
+
+    kind = detect_kind(ir_class)
+    if kind is None:
+        print(f"⚠️  No matching generator for: {ir_class.name}")
+        return []
+
+    print(f"📦 Detected {KIND_LABELS[kind]}: {ir_class.name}")
+    generator = generators[kind]
+    if render_cache is not None:
+        outputs = render_cache.generate_and_save(generator, ir_class)
     else:
-        result = subprocess.run(
-            ["node", str(TS_PARSER_PATH), "--input", ts_file],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return json.loads(result.stdout)
-
-def collect_ts_files(inputs: list) -> list:
-    """Recursively collect all .ts files from given files/directories."""
-    ts_files = []
-    for input_path in inputs:
-        path = Path(input_path)
-        if path.is_dir():
-            ts_files.extend(path.rglob("*.ts"))
-        elif path.is_file() and path.suffix == ".ts":
-            ts_files.append(path)
-    return list(map(str, ts_files))
+        outputs = generator.generate_and_save(ir_class)
+    return [(generator.base_output_dir / path, code) for path, code in outputs]
 
-def main():
-    parser = argparse.ArgumentParser(description="Convert TypeScript to IR and target code.")
-    parser.add_argument("--input", nargs="+", required=True, help="Paths to TypeScript files or directories")
-    parser.add_argument("--lang", required=False, default="ir", choices=["ir", "java", "python"], help="Target language (default: IR only)")
-    parser.add_argument("--output-dir", required=False, help="Output directory for generated code.")
-    parser.add_argument("--package", required=False, help="Java package name (e.g., com.example.app)")
+def discover_sources(args) -> list:
+    discovery = SourceDiscovery(
+        include=args.include,
+        exclude=args.exclude,
+        tsconfig=args.tsconfig,
+        use_gitignore=not args.no_gitignore,
+        excluded_dirs=() if args.no_default_excludes else DEFAULT_EXCLUDED_DIRS,
+    ).discover(args.input)
 
-    args = parser.parse_args()
+    skipped = sum(discovery.skipped_files.values())
+    if skipped or discovery.pruned_dirs:
+        print(f"🙈 Skipped {skipped} TypeScript file(s):")
+        for line in discovery.report():
+            print(line)
+    return discovery.files
+
+def open_ir_writer(args, stdout) -> IRWriter:
+    binary = args.format == "msgpack"
+    if args.ir_output == "-":
+        stream = stdout.buffer if binary else stdout
+    else:
+        stream = open(args.ir_output, "wb" if binary else "w", encoding=None if binary else "utf-8")
+    return IRWriter(stream, args.format)
 
-    ts_files = collect_ts_files(args.input)
-    if not ts_files:
-        print("🚫 No TypeScript files found.")
-        return
+async def run(args, stdout=sys.stdout, shared: Optional[SharedState] = None) -> int:
+    ts_files = []
+    to_parse = []
+    if not args.from_ir:
+        ts_files = discover_sources(args)
+        if not ts_files:
+            print("🚫 No TypeScript files found.")
+            return 0
 
-    print(f"📁 Found {len(ts_files)} TypeScript files to parse.")
+        print(f"📁 Found {len(ts_files)} TypeScript files to parse.")
 
-    all_ir_classes = []
-    for ts_file in ts_files:
-        print(f"🔍 Parsing: {ts_file}")
-        ts_ast = parse_typescript_file(ts_file)
-        ir_classes = build_ir_from_json(ts_ast)
-        all_ir_classes.extend(ir_classes)
+        to_parse = ts_files
+        if args.only or args.classes:
+            to_parse = prescan_sources(ts_files, args, shared.prescan_index if shared else None)
 
+    emit = None
+    render_cache = None
+    ir_writer = None
+    journal = None
+    dedup = None
     if args.lang == "ir":
-        print("✅ IR Output:")
-        for ir_cls in all_ir_classes:
-            print(ir_cls)
-
+        if args.format == "repr":
+            print("✅ IR Output:")
+            emit = print
+        else:
+            ir_writer = open_ir_writer(args, stdout)
+            emit = ir_writer.write
     elif args.lang == "java":
         print("🛠️  Generating Java Code (Phase 4.5)...\n")
         output_dir = Path(args.output_dir) if args.output_dir else Path("out/java")
         package = args.package or "com.example.demo"
 
         scaffold_gradle_project(output_dir, package)
+        generators = build_java_generators(output_dir, package)
+        if shared is not None:
+            render_cache = shared.render_cache
+        elif args.cache_dir:
+            render_cache = RenderCache(Path(args.cache_dir) / "render", max_bytes=args.render_cache_max_mb * 1024 * 1024)
+        emit = functools.partial(generate_java, generators=generators, render_cache=render_cache)
+        dedup = ClassDeduplicator()
+        if not args.from_ir and not args.ir_store:
+            journal = RunJournal(output_dir, journal_config(args, package, generators), resume=args.resume)
+            if journal.resumed:
+                pending = journal.pending(to_parse)
+                print(f"⏭️  Resuming: {len(to_parse) - len(pending)} file(s) already done, {len(pending)} to go")
+                # Classes from skipped files still count as seen for dedup and collisions
+                for done in set(to_parse) - set(pending):
+                    for name, digest in journal.classes.get(done, []):
+                        dedup.remember(name, digest, done)
+                to_parse = pending
+        emit = functools.partial(emit_if_unique, emit=emit, dedup=dedup, journal=journal)
+
+    if emit is not None and (args.only or args.classes):
+        emit = functools.partial(emit_if_selected, emit=emit, kinds=set(args.only or []), names=set(args.classes or []))
+
+    failures = []
+    store = IRStore(args.ir_store) if args.ir_store else None
+    try:
+        if args.from_ir:
+            # Saved IR snapshot: no TypeScript parsing at all
+            print(f"📥 Loading IR snapshot: {args.from_ir}")
+            for ir_class in iter_ir_from_file(args.from_ir, lazy=args.lang == "java"):
+                if emit is not None:
+                    emit(ir_class)
+        else:
+            if store is not None and len(to_parse) < len(ts_files):
+                forget_changed(store, set(ts_files) - set(to_parse))
+            failures = await parse_sources(to_parse, args, emit, store, journal, shared.parse_slots if shared else None)
+            if store is not None:
+                emit_from_store(store, ts_files, args, emit)
+    finally:
+        if store is not None:
+            store.close()
+        if journal is not None:
+            journal.close()
+        if ir_writer is not None:
+            ir_writer.close()
+            if args.ir_output != "-":
+                ir_writer.stream.close()
+
+    if ir_writer is not None:
+        target = "stdout" if args.ir_output == "-" else args.ir_output
+        print(f"✅ Wrote {ir_writer.count} IR class(es) as {args.format} to {target}")
+
+    if dedup is not None:
+        for line in dedup.report():
+            print(line)
+
+    if render_cache is not None and shared is None:
+        render_cache.evict()
+        print(render_cache.report())
 
-        controller_generator = ControllerGenerator(base_package=package, base_output_dir=output_dir)
-        service_generator = ServiceGenerator(base_package=package, base_output_dir=output_dir)
-        dto_generator = DtoGenerator(base_package=package, base_output_dir=output_dir)
-        entity_generator = EntityGenerator(base_package=package, base_output_dir=output_dir)
-        repository_generator = RepositoryGenerator(output_dir, package)
+    if failures:
+        print(f"\n❌ {len(failures)} of {len(ts_files)} file(s) failed to parse:")
+        for result in failures:
+            print(f"   - {result.source_file}: {_summarize_error(result.error)}")
+        return 1
+    return 0
 
+async def run_batch(targets: list, batch_args, parallel: int = 1) -> int:
+    """Run several (name, args) targets in one process, sharing caches and parser slots."""
+    cache_dir = Path(batch_args.cache_dir) if batch_args.cache_dir else None
+    shared = SharedState(
+        prescan_index=PrescanIndex(cache_dir / "prescan.json" if cache_dir else None),
+        parse_slots=asyncio.Semaphore(batch_args.parse_concurrency),
+    )
+    if cache_dir:
+        shared.render_cache = RenderCache(cache_dir / "render", max_bytes=batch_args.render_cache_max_mb * 1024 * 1024)
 
-        for ir_class in all_ir_classes:
-            print("🔍 Debug IRClass:", ir_class.name)
-            # print("    Base classes:", ir_class.base_classes)
-            print("    Decorators:", [d.name for d in ir_class.decorators])
+    print(f"📋 Batch: {len(targets)} target(s), up to {parallel} at a time")
+    running = asyncio.Semaphore(parallel)
 
-            name_lower = ir_class.name.lower()
-            decorator_names = [d.name.lower() for d in ir_class.decorators]
+    async def run_target(name: str, args) -> int:
+        async with running:
+            print(f"\n🎯 Target: {name}")
+            try:
+                return await run(args, shared=shared)
+            except Exception as exc:
+                # One broken target shouldn't abort the others
+                print(f"❌ Target {name} crashed: {type(exc).__name__}: {exc}")
+                return 1
 
-            print(f"📦 Scanning: {ir_class.name}, decorators={decorator_names}")
+    codes = await asyncio.gather(*(run_target(name, args) for name, args in targets))
 
-            # Controller
-            if "controller" in decorator_names:
-                print(f"📦 Detected Controller: {ir_class.name}")
-                controller_generator.generate_and_save(ir_class)
+    shared.prescan_index.save()
+    if shared.render_cache is not None:
+        shared.render_cache.evict()
+        print(shared.render_cache.report())
 
-            # Repository (by name or decorator)
-            elif is_repository_class(ir_class):
-                print(f"📦 Detected Repository: {ir_class.name}")
-                repository_generator.generate_and_save(ir_class)
+    print(f"\n📋 Batch finished: {codes.count(0)} of {len(targets)} target(s) succeeded")
+    for (name, _), code in zip(targets, codes):
+        if code:
+            print(f"   - ❌ {name}")
+    return max(codes)
 
-            # Service
-            elif "service" in decorator_names or "injectable" in decorator_names:
-                print(f"📦 Detected Service: {ir_class.name}")
-                service_generator.generate_and_save(ir_class)
+def prescan_sources(ts_files: list, args, index: Optional[PrescanIndex] = None) -> list:
+    """Drop files whose raw text shows they cannot contain a selected class."""
+    owned = index is None
+    if owned:
+        cache_path = Path(args.cache_dir) / "prescan.json" if args.cache_dir else None
+        index = PrescanIndex(cache_path)
+    reused, scanned = index.reused, index.scanned
+    selected = index.select(ts_files, kinds=set(args.only or []), class_names=set(args.classes or []))
+    if owned:
+        index.save()
+    print(f"🔎 Pre-scan kept {len(selected)} of {len(ts_files)} file(s) "
+          f"({index.reused - reused} from cache, {index.scanned - scanned} scanned)")
+    return selected
 
-            # DTO
-            elif ir_class.name.endswith("Dto") and not decorator_names:
-                print(f"📦 Detected DTO: {ir_class.name}")
-                dto_generator.generate_and_save(ir_class)
+def forget_changed(store: IRStore, paths: set):
+    # Pre-scan skipped these; if they changed since the store saw them, their
+    # rows are stale and must not be emitted. The next unfiltered run re-parses them.
+    for path in paths:
+        st = os.stat(path)
+        if not store.is_current(path, st.st_mtime_ns, st.st_size):
+            store.forget(path)
+
+def journal_config(args, package: str, generators: dict) -> dict:
+    # Anything that changes what a file produces must invalidate the journal
+    return {
+        "package": package,
+        "generators": {kind: generator.VERSION for kind, generator in generators.items()},
+        "only": sorted(args.only or []),
+        "classes": sorted(args.classes or []),
+    }
+
+def emit_if_selected(ir_class, emit, kinds: set, names: set):
+    if names and ir_class.name not in names:
+        return None
+    if kinds and detect_kind(ir_class) not in kinds:
+        return None
+    return emit(ir_class)
+
+def emit_if_unique(ir_class, emit, dedup: ClassDeduplicator, journal: Optional[RunJournal] = None):
+    # Copy-pasted classes map to the same output files; write them once
+    digest = semantic_hash(ir_class)
+    if not dedup.first_seen(ir_class, digest):
+        print(f"🧬 Duplicate of an earlier {ir_class.name}, skipped: {ir_class.source_file}")
+        if journal is not None:
+            journal.record_duplicate(ir_class.source_file, ir_class.name, digest)
+        return None
+    outputs = emit(ir_class)
+    if journal is not None:
+        journal.record_generated(ir_class.source_file, ir_class.name, digest, outputs)
+    return outputs
+
+async def parse_sources(ts_files: list, args, emit, store, journal: Optional[RunJournal] = None,
+                        parse_slots: Optional[asyncio.Semaphore] = None) -> list:
+    """Parse `ts_files` and route each file's IR to the store or straight to output."""
+    to_parse = ts_files
+    stats = {}
+    if store is not None:
+        for ts_file in ts_files:
+            stats[ts_file] = os.stat(ts_file)
+        to_parse = [f for f in ts_files if not store.is_current(f, stats[f].st_mtime_ns, stats[f].st_size)]
+        if len(to_parse) < len(ts_files):
+            print(f"♻️  {len(ts_files) - len(to_parse)} unchanged file(s) already in IR store: {args.ir_store}")
+
+    # Parsing runs concurrently; IR building and generation consume results
+    # in discovery order so output does not depend on which process finishes
+    # first, and only a bounded number of ASTs are held at once.
+    failures = []
+    async with contextlib.aclosing(iter_parse_results(to_parse, concurrency=args.parse_concurrency, slots=parse_slots)) as results:
+        async for result in results:
+            if not result.ok:
+                print(f"❌ Failed to parse: {result.source_file}")
+                failures.append(result)
+                if store is not None:
+                    # Rows from an earlier successful parse no longer describe the file
+                    store.forget(result.source_file)
+                continue
+
+            print(f"🔍 Parsed: {result.source_file}")
+            # Generators only materialize the members they read; the IR dump needs all of them
+            ir_classes = build_ir_from_json(result.ast, source_file=result.source_file, lazy=args.lang == "java")
+            if store is not None:
+                st = stats[result.source_file]
+                store.replace_file(result.source_file, ir_classes, st.st_mtime_ns, st.st_size)
+                continue
+
+            if journal is not None:
+                journal.record_parsed(result.source_file)
+            if emit is not None:
+                for ir_class in ir_classes:
+                    emit(ir_class)
+            if journal is not None:
+                journal.record_completed(result.source_file)
+    return failures
+
+def emit_from_store(store: IRStore, ts_files: list, args, emit):
+    pruned = store.prune(ts_files)
+    if pruned:
+        print(f"🧹 Removed {pruned} deleted/excluded file(s) from IR store")
+
+    if args.lang == "ir":
+        for ir_class in store.query(kind=args.query_kind, name=args.query_name, route_prefix=args.query_route_prefix):
+            emit(ir_class)
+    elif emit is not None:
+        # Generators read one kind at a time in batches, so memory stays bounded by batch size
+        for kind in JAVA_KINDS + [None]:
+            if args.only and kind not in args.only:
+                continue
+            for batch in store.iter_batches(kind, batch_size=args.ir_batch_size):
+                for ir_class in batch:
+                    emit(ir_class)
+
+def _summarize_error(error: str) -> str:
+    lines = [line.strip() for line in error.splitlines() if line.strip()]
+    # Node stack traces start with a loader frame; the useful part is the Error line
+    return next((line for line in lines if "Error" in line), lines[0] if lines else error)
+
+def _comma_list(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def check_args(args) -> Optional[str]:
+    if not args.input and not args.from_ir:
+        return "one of --input or --from-ir is required"
+    if args.from_ir and (args.input or args.ir_store):
+        return "--from-ir cannot be combined with --input or --ir-store"
+    if args.resume and (args.lang != "java" or args.from_ir or args.ir_store):
+        return "--resume only applies to --lang java runs from --input without --ir-store"
+    unknown_kinds = set(args.only or []) - set(JAVA_KINDS)
+    if unknown_kinds:
+        return f"--only: unknown kind(s) {', '.join(sorted(unknown_kinds))}; choose from {', '.join(JAVA_KINDS)}"
+    if args.parse_concurrency < 1:
+        return "--parse-concurrency must be at least 1"
+    if args.ir_batch_size < 1:
+        return "--ir-batch-size must be at least 1"
+    if not args.ir_store and (args.query_kind or args.query_name or args.query_route_prefix):
+        return "--query-* options require --ir-store"
+    return None
+
+def build_batch_targets(parser, args, config) -> list:
+    """One args namespace per target: command-line options, overridden by the config."""
+    known = set(vars(args)) - {"config"}
+    base = {**vars(args), **{k: v for k, v in config.settings.items() if k in known}}
+    targets = []
+    # Resolved output directory, IR file or IR store -> target name
+    outputs = {}
+    for target in config.targets:
+        unknown = set(target.settings) - known
+        if unknown:
+            parser.error(f"--config: target {target.name!r}: unknown option(s) {', '.join(sorted(unknown))}")
+        target_args = argparse.Namespace(**{**base, **target.settings})
+        if "resume" not in target.settings and (target_args.lang != "java" or target_args.from_ir or target_args.ir_store):
+            # A command-line --resume applies to the targets that support it
+            target_args.resume = False
+        error = check_args(target_args)
+        if not error and target_args.lang == "ir" and target_args.format != "repr" and target_args.ir_output == "-":
+            error = "structured IR output needs ir_output set to a file in batch runs"
+        if error:
+            parser.error(f"--config: target {target.name!r}: {error}")
+        written = []
+        if target_args.lang == "java":
+            written.append(target_args.output_dir or "out/java")
+        elif target_args.lang == "ir" and target_args.format != "repr":
+            written.append(target_args.ir_output)
+        if target_args.ir_store:
+            # A store prunes rows for files outside its own inputs, so it can't be shared
+            written.append(target_args.ir_store)
+        for output in (Path(path).resolve() for path in written):
+            if output in outputs:
+                parser.error(f"--config: targets {outputs[output]!r} and {target.name!r} both write to {output}")
+            outputs[output] = target.name
+        targets.append((target.name, target_args))
+    return targets
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Convert TypeScript to IR and target code.")
+    parser.add_argument("--config", metavar="TOML", help="Convert every [[targets]] entry of this batch config (e.g. ts2many.toml) in one process")
+    parser.add_argument("--input", nargs="+", help="Paths to TypeScript files or directories")
+    parser.add_argument("--from-ir", metavar="SNAPSHOT", help="Skip TypeScript parsing and read IR from a snapshot written with --format json|ndjson|msgpack")
+    parser.add_argument("--lang", required=False, default="ir", choices=["ir", "java", "python"], help="Target language (default: IR only)")
+    parser.add_argument("--output-dir", required=False, help="Output directory for generated code.")
+    parser.add_argument("--package", required=False, help="Java package name (e.g., com.example.app)")
+    parser.add_argument("--only", type=_comma_list, metavar="KINDS", help=f"Only process these kinds, comma-separated ({','.join(JAVA_KINDS)})")
+    parser.add_argument("--classes", type=_comma_list, metavar="NAMES", help="Only process these classes, comma-separated")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted --lang java run, skipping files the output journal shows as done")
+    parser.add_argument("--format", default="repr", choices=["repr"] + IR_FORMATS, help="IR output format for --lang ir (default: repr)")
+    parser.add_argument("--ir-output", default="-", metavar="FILE", help="Where --lang ir writes json/ndjson/msgpack output (default: stdout)")
+    parser.add_argument("--include", action="append", metavar="PATTERN", help="Only parse files matching this glob (repeatable, relative to each input directory)")
+    parser.add_argument("--exclude", action="append", metavar="PATTERN", help="Skip files/directories matching this .gitignore-style pattern (repeatable)")
+    parser.add_argument("--tsconfig", required=False, help="Honor include/exclude from this tsconfig.json")
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not honor .gitignore files found in input directories")
+    parser.add_argument("--no-default-excludes", action="store_true", help="Also walk node_modules, dist, build, out and the other directories skipped by default")
+    parser.add_argument("--parse-concurrency", type=int, default=DEFAULT_PARSE_CONCURRENCY, help=f"Maximum parser processes running at once (default: {DEFAULT_PARSE_CONCURRENCY})")
+    parser.add_argument("--cache-dir", required=False, help="Directory for persistent caches (rendered Java is reused across runs)")
+    parser.add_argument("--render-cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024), help="Evict least recently used renders beyond this size (default: %(default)s)")
+    parser.add_argument("--ir-store", required=False, metavar="DB", help="Persist IR in this SQLite database; later runs only re-parse changed files")
+    parser.add_argument("--ir-batch-size", type=int, default=200, help="Classes loaded from the IR store per batch (default: 200)")
+    parser.add_argument("--query-kind", choices=JAVA_KINDS, help="With --lang ir and --ir-store: only list classes of this kind")
+    parser.add_argument("--query-name", help="With --lang ir and --ir-store: only list classes with this name")
+    parser.add_argument("--query-route-prefix", help="With --lang ir and --ir-store: only list controllers whose route starts with this prefix")
+    return parser
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.config:
+        if args.input or args.from_ir:
+            parser.error("--config cannot be combined with --input or --from-ir; list inputs per target")
+        try:
+            config = load_batch_config(args.config)
+        except BatchConfigError as exc:
+            parser.error(f"--config: {exc}")
+        targets = build_batch_targets(parser, args, config)
+        raise SystemExit(asyncio.run(run_batch(targets, targets[0][1], parallel=config.parallel)))
 
-            # Entity
-            elif "entity" in decorator_names:
-                print(f"📦 Detected Entity: {ir_class.name}")
-                entity_generator.generate_and_save(ir_class)
+    error = check_args(args)
+    if error:
+        parser.error(error)
 
-            # No match
-            else:
-                print(f"⚠️  No matching generator for: {ir_class.name}")
+    if args.lang == "ir" and args.format != "repr" and args.ir_output == "-":
+        # stdout carries the IR stream; progress messages go to stderr
+        stdout = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            raise SystemExit(asyncio.run(run(args, stdout=stdout)))
+    raise SystemExit(asyncio.run(run(args)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+# tests/test_async_runner.py
+
+import asyncio
+
+import pytest
+
+import ts_parser.async_runner as async_runner
+from ts_parser.async_runner import BridgeError, iter_parse_results
+
+
+class StubBridge:
+    """Stands in for parse_file_async; records how many parses run at once."""
+
+    def __init__(self, delays=None, errors=None):
+        self.delays = delays or {}
+        self.errors = errors or {}
+        self.started = []
+        self.running = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def __call__(self, ts_file, *args):
+        self.started.append(ts_file)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(ts_file, 0))
+            if ts_file in self.errors:
+                raise self.errors[ts_file]
+            return [{"name": ts_file}]
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    def install(**kwargs):
+        stub = StubBridge(**kwargs)
+        monkeypatch.setattr(async_runner, "parse_file_async", stub)
+        return stub
+    return install
+
+
+def collect(files, **kwargs):
+    async def consume():
+        return [result async for result in iter_parse_results(files, **kwargs)]
+    return asyncio.run(asyncio.wait_for(consume(), 5))
+
+
+def test_results_follow_input_order(bridge):
+    files = [f"f{i}.ts" for i in range(12)]
+    # Earlier files finish last
+    stub = bridge(delays={f: 0.002 * (12 - i) for i, f in enumerate(files)})
+    results = collect(files, concurrency=4)
+    assert [r.source_file for r in results] == files
+    assert all(r.ok and r.ast == [{"name": r.source_file}] for r in results)
+    assert stub.peak == 4
+
+
+def test_slow_consumer_caps_parsing_ahead(bridge):
+    files = [f"f{i}.ts" for i in range(30)]
+    stub = bridge()
+    ahead = []
+
+    async def consume():
+        yielded = 0
+        async for _ in iter_parse_results(files, concurrency=3, queue_size=2):
+            yielded += 1
+            ahead.append(len(stub.started) - yielded)
+            await asyncio.sleep(0.001)
+        return yielded
+
+    assert asyncio.run(asyncio.wait_for(consume(), 5)) == 30
+    assert max(ahead) <= 3 + 2
+
+
+def test_slow_first_file_caps_parsing_ahead(bridge):
+    files = [f"f{i}.ts" for i in range(30)]
+    stub = bridge(delays={"f0.ts": 0.05})
+    first_yield = []
+
+    async def consume():
+        async for _ in iter_parse_results(files, concurrency=3, queue_size=2):
+            if not first_yield:
+                first_yield.append(len(stub.started))
+
+    asyncio.run(asyncio.wait_for(consume(), 5))
+    assert first_yield == [3 + 2]
+
+
+@pytest.mark.parametrize("error", [BridgeError("Error: boom"), ValueError("bad json"), RuntimeError("unexpected")])
+def test_failures_become_results(bridge, error):
+    bridge(errors={"b.ts": error})
+    results = collect(["a.ts", "b.ts", "c.ts"], concurrency=2)
+    assert [(r.source_file, r.ok) for r in results] == [("a.ts", True), ("b.ts", False), ("c.ts", True)]
+    assert results[1].error == str(error)
+
+
+def test_closing_early_cancels_workers(bridge):
+    files = [f"f{i}.ts" for i in range(10)]
+    stub = bridge(delays={f: 10 for f in files[1:]})
+
+    async def consume_one():
+        results = iter_parse_results(files, concurrency=4)
+        first = await results.__anext__()
+        await results.aclose()
+        return first, [t for t in asyncio.all_tasks() if t.get_coro().__name__ == "worker"]
+
+    first, leftover = asyncio.run(asyncio.wait_for(consume_one(), 5))
+    assert first.source_file == "f0.ts"
+    assert stub.cancelled == 4
+    assert leftover == []
+
+
+def test_shared_slots_cap_concurrent_calls(bridge):
+    stub = bridge(delays={f"{p}{i}.ts": 0.002 for p in "ab" for i in range(8)})
+
+    async def both():
+        slots = asyncio.Semaphore(3)
+
+        async def drain(prefix):
+            files = [f"{prefix}{i}.ts" for i in range(8)]
+            return [r async for r in iter_parse_results(files, concurrency=4, slots=slots)]
+
+        return await asyncio.gather(drain("a"), drain("b"))
+
+    a, b = asyncio.run(asyncio.wait_for(both(), 5))
+    assert len(a) == len(b) == 8
+    assert stub.peak == 3
@@ -0,0 +1,74 @@
+# tests/test_batch_config.py
+
+import pytest
+
+import main
+from utils.batch_config import BatchConfigError, load_batch_config
+
+
+def targets_for(tmp_path, text):
+    path = tmp_path / "ts2many.toml"
+    path.write_text(text)
+    parser = main.build_parser()
+    return main.build_batch_targets(parser, parser.parse_args(["--config", str(path)]), load_batch_config(str(path)))
+
+
+def test_targets_inherit_defaults_and_resolve_paths(tmp_path):
+    targets = targets_for(tmp_path, """
+parallel = 2
+[defaults]
+lang = "java"
+[[targets]]
+name = "users"
+input = "apps/users"
+output-dir = "out/users"
+package = "com.acme.users"
+""")
+    [(name, args)] = targets
+    assert name == "users"
+    assert (args.lang, args.package) == ("java", "com.acme.users")
+    assert args.input == [str(tmp_path / "apps/users")]
+    assert args.output_dir == str(tmp_path / "out/users")
+
+
+@pytest.mark.parametrize("shared", [
+    '[defaults]\nlang = "java"\n',
+    '[defaults]\nlang = "ir"\nformat = "json"\nir_output = "ir.json"\n',
+    '[defaults]\nlang = "ir"\nir_store = "ir.db"\n',
+    '[defaults]\nlang = "java"\nir_store = "ir.db"\n[[targets]]\ninput = "a"\noutput_dir = "a"\n'
+    '[[targets]]\ninput = "b"\noutput_dir = "b"\n',
+])
+def test_rejects_targets_sharing_an_output(tmp_path, capsys, shared):
+    if "[[targets]]" not in shared:
+        shared += '[[targets]]\ninput = "a"\n[[targets]]\ninput = "b"\n'
+    with pytest.raises(SystemExit):
+        targets_for(tmp_path, shared)
+    assert "both write to" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("text, message", [
+    ("parallel = 0\n[[targets]]\ninput = 'a'\n", "parallel must be a positive integer"),
+    ("[defaults]\nlang = 'java'\n", "at least one [[targets]]"),
+    ("[[targets]]\ninput = 'a'\ncache_dir = 'c'\n", "can only be set at the top level"),
+    ("[[targets]\n", "ts2many.toml"),
+])
+def test_malformed_configs(tmp_path, text, message):
+    path = tmp_path / "ts2many.toml"
+    path.write_text(text)
+    with pytest.raises(BatchConfigError, match=message.replace("[", r"\[")):
+        load_batch_config(str(path))
+
+
+def test_missing_toml_parser_is_a_config_error(tmp_path, monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_toml(name, *args, **kwargs):
+        if name in ("tomllib", "tomli"):
+            raise ModuleNotFoundError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_toml)
+    with pytest.raises(BatchConfigError, match="tomli"):
+        load_batch_config(str(tmp_path / "ts2many.toml"))
@@ -0,0 +1,87 @@
+# tests/test_decorator_parser.py
+
+import pytest
+
+from ir.decorator_parser import decorator_source, parse_decorator
+from ir.ir_models import IRDecoratorArg
+
+
+def arg(kind, value, raw=None):
+    return IRDecoratorArg(kind, value, raw if raw is not None else str(value))
+
+
+@pytest.mark.parametrize("raw, name, arguments, args", [
+    ("@Injectable", "Injectable", None, ()),
+    ("@Injectable()", "Injectable", "", ()),
+    ("@Controller('users')", "Controller", "'users'", (arg("string", "users", "'users'"),)),
+    ('@Get("a\\"b")', "Get", '"a\\"b"', (arg("string", 'a"b', '"a\\"b"'),)),
+    ("@Max(10)", "Max", "10", (arg("number", 10),)),
+    ("@IsIn([1, 2.5, -3])", "IsIn", "[1, 2.5, -3]", (
+        arg("array", (arg("number", 1), arg("number", 2.5), arg("number", -3)), "[1, 2.5, -3]"),
+    )),
+    ("@Column({ nullable: true, default: null })", "Column", "{ nullable: true, default: null }", (
+        arg("object", (("nullable", arg("boolean", True, "true")), ("default", arg("null", None, "null"))),
+            "{ nullable: true, default: null }"),
+    )),
+    ("@Column({ 'type': 'int', length })", "Column", "{ 'type': 'int', length }", (
+        arg("object", (("type", arg("string", "int", "'int'")), ("length", arg("identifier", "length"))),
+            "{ 'type': 'int', length }"),
+    )),
+    ("@ApiResponse({ type: [User] })", "ApiResponse", "{ type: [User] }", (
+        arg("object", (("type", arg("array", (arg("identifier", "User"),), "[User]")),), "{ type: [User] }"),
+    )),
+    ("@Module.Global()", "Module.Global", "", ()),
+    ("// note\n  @Optional()", "Optional", "", ()),
+])
+def test_parses_literals(raw, name, arguments, args):
+    decorator = parse_decorator(raw)
+    assert (decorator.name, decorator.arguments, decorator.args) == (name, arguments, args)
+
+
+@pytest.mark.parametrize("raw, expressions", [
+    ("@Inject(forwardRef(() => UsersService))", ["forwardRef(() => UsersService)"]),
+    ("@OneToMany(() => Post, (post) => post.author)", ["() => Post", "(post) => post.author"]),
+    ("@Param('id', new ParseIntPipe())", ["new ParseIntPipe()"]),
+    ("@Header('x', `v${version}`)", ["`v${version}`"]),
+    ("@Column({ ...base })", ["{ ...base }"]),
+    ("@Min(a + 1)", ["a + 1"]),
+])
+def test_falls_back_to_expressions(raw, expressions):
+    decorator = parse_decorator(raw)
+    assert [a.value for a in decorator.args if a.kind == "expression"] == expressions
+    # Every argument keeps its source text
+    assert ", ".join(a.raw for a in decorator.args) == decorator.arguments
+
+
+@pytest.mark.parametrize("raw, name, type_arguments, arguments", [
+    ("@Foo<T>()", "Foo", "<T>", ""),
+    ("@Type<User>('x')", "Type", "<User>", "'x'"),
+    ("@Foo<Map<string, () => void>>(1)", "Foo", "<Map<string, () => void>>", "1"),
+])
+def test_keeps_type_arguments(raw, name, type_arguments, arguments):
+    decorator = parse_decorator(raw)
+    assert (decorator.name, decorator.type_arguments, decorator.arguments) == (name, type_arguments, arguments)
+
+
+@pytest.mark.parametrize("raw", [
+    "@Injectable",
+    "@Get()",
+    "@Controller({ path: 'users', version: '1' })",
+    "@Foo<T>(a, b)",
+    "@Inject(forwardRef(() => X))",
+])
+def test_decorator_source_round_trips(raw):
+    assert decorator_source(parse_decorator(raw)) == raw
+
+
+def test_string_and_option_helpers():
+    decorator = parse_decorator("@Controller({ path: 'users', host: h })")
+    assert decorator.string_arg() is None
+    assert decorator.string_option("path") == "users"
+    assert decorator.string_option("host") is None
+    assert decorator.option("missing") is None
+    assert parse_decorator("@Get(':id')").string_arg() == ":id"
+
+
+def test_results_are_shared():
+    assert parse_decorator("@Body()") is parse_decorator("@Body()")
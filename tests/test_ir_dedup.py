@@ -0,0 +1,88 @@
+# tests/test_ir_dedup.py
+
+import copy
+
+import pytest
+
+from ir.ir_builder import build_ir_from_json
+from ir.ir_dedup import ClassDeduplicator, semantic_hash
+from ir.ir_store import IRStore
+
+RECORD = {
+    "name": "CreateUserDto",
+    "decorators": ["@ApiSchema({ name: 'CreateUser' })"],
+    "extends": None,
+    "implements": [],
+    "properties": [
+        {"name": "email", "type": "string", "isReadonly": False, "access": "public",
+         "decorators": ["@IsEmail()", "@ApiProperty({ required: true })"]},
+    ],
+    "constructorParams": [{"name": "repo", "type": "UserRepository", "decorators": ["@Inject(REPO)"]}],
+    "methods": [
+        {"name": "find", "returnType": "Promise<User>", "decorators": ["@Get(':id')"],
+         "parameters": [{"name": "id", "type": "string", "decorators": ["@Param('id')"]}]},
+    ],
+}
+
+
+def variant(edit):
+    record = copy.deepcopy(RECORD)
+    edit(record)
+    return record
+
+
+def build(record, lazy, source_file="a.ts"):
+    return build_ir_from_json([record], source_file=source_file, lazy=lazy)[0]
+
+
+@pytest.mark.parametrize("edit", [
+    lambda r: r["properties"][0]["decorators"].__setitem__(0, "/** The login. */\n  @IsEmail()"),
+    lambda r: r["decorators"].__setitem__(0, "// schema\n@ApiSchema({ name: 'CreateUser' })"),
+    lambda r: r["methods"][0].__setitem__("isStatic", True),
+    lambda r: r["properties"][0].__setitem__("isStatic", False),
+    lambda r: r.__setitem__("sourceFile", "elsewhere.ts"),
+])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_ignores_trivia_and_fields_outside_the_ir(edit, lazy):
+    a, b = build(RECORD, lazy), build(variant(edit), lazy)
+    assert a == b
+    assert semantic_hash(a) == semantic_hash(b)
+
+
+@pytest.mark.parametrize("edit", [
+    lambda r: r["properties"][0].__setitem__("type", "number"),
+    lambda r: r["properties"][0]["decorators"].pop(),
+    lambda r: r["methods"][0]["parameters"][0].__setitem__("decorators", ["@Query('id')"]),
+    lambda r: r["constructorParams"].clear(),
+    lambda r: r.__setitem__("extends", "BaseDto"),
+])
+def test_body_changes_change_the_hash(edit):
+    assert semantic_hash(build(RECORD, True)) != semantic_hash(build(variant(edit), True))
+
+
+def test_lazy_eager_and_store_classes_agree(tmp_path):
+    lazy = build(RECORD, True)
+    expected = semantic_hash(build(RECORD, False))
+    assert semantic_hash(lazy) == expected
+    assert "properties" not in vars(lazy)
+
+    # Once every member is built the record is dropped; the hash must not move
+    lazy.properties, lazy.constructor_params, lazy.methods
+    assert "_record" not in vars(lazy)
+    assert semantic_hash(lazy) == expected
+
+    with IRStore(str(tmp_path / "ir.db")) as store:
+        store.replace_file("a.ts", [build(RECORD, False)], 1, 1)
+        assert semantic_hash(next(store.query())) == expected
+
+
+def test_deduplicator_counts_duplicates_and_collisions():
+    dedup = ClassDeduplicator()
+    assert dedup.first_seen(build(RECORD, True, "a.ts"))
+    assert not dedup.first_seen(build(RECORD, True, "b.ts"))
+    changed = variant(lambda r: r["properties"][0].__setitem__("type", "number"))
+    assert dedup.first_seen(build(changed, True, "c.ts"))
+    dedup.remember("CreateUserDto", semantic_hash(build(changed, False)), "d.ts")
+
+    assert dedup.duplicates == 1
+    assert dedup.collisions() == {"CreateUserDto": [["a.ts", "b.ts"], ["c.ts", "d.ts"]]}
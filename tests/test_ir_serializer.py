@@ -0,0 +1,51 @@
+# tests/test_ir_serializer.py
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from ir.ir_builder import build_ir_from_json, iter_ir_from_file
+from ir.ir_serializer import IRWriter
+
+AST = json.loads((Path(__file__).parent / "ast_output.json").read_text())
+SUFFIXES = {"json": ".json", "ndjson": ".ndjson", "msgpack": ".msgpack"}
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "msgpack"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_snapshot_round_trip(tmp_path, fmt, lazy):
+    if fmt == "msgpack":
+        pytest.importorskip("msgpack")
+    classes = build_ir_from_json(AST * 3, source_file="src/a.ts")
+    path = tmp_path / f"ir{SUFFIXES[fmt]}"
+    with open(path, "wb" if fmt == "msgpack" else "w") as stream:
+        writer = IRWriter(stream, fmt)
+        for ir_class in classes:
+            writer.write(ir_class)
+        writer.close()
+    assert writer.count == len(classes)
+    assert list(iter_ir_from_file(str(path), lazy=lazy)) == classes
+
+
+def test_empty_json_snapshot_is_valid():
+    stream = io.StringIO()
+    IRWriter(stream, "json").close()
+    assert json.loads(stream.getvalue()) == []
+
+
+def test_records_use_bridge_schema():
+    ir_class = build_ir_from_json(AST, source_file="src/a.ts")[0]
+    stream = io.StringIO()
+    writer = IRWriter(stream, "ndjson")
+    writer.write(ir_class)
+    record = json.loads(stream.getvalue())
+    assert set(record) == set(AST[0]) | {"sourceFile"}
+    # Snapshot records load back through the same builder as bridge output
+    assert build_ir_from_json([record], source_file=record["sourceFile"]) == [ir_class]
+
+
+def test_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        IRWriter(io.StringIO(), "yaml")
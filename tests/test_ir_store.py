@@ -0,0 +1,51 @@
+# tests/test_ir_store.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ir.ir_builder import build_ir_from_json
+from ir.ir_store import IRStore
+
+AST = json.loads((Path(__file__).parent / "ast_output.json").read_text())
+
+
+@pytest.fixture
+def store(tmp_path):
+    with IRStore(str(tmp_path / "ir.db")) as store:
+        yield store
+
+
+def test_round_trip(store):
+    classes = build_ir_from_json(AST, source_file="a.ts")
+    store.replace_file("a.ts", classes, mtime_ns=1, size=2)
+    assert list(store.query()) == classes
+    assert store.is_current("a.ts", 1, 2)
+    assert not store.is_current("a.ts", 1, 3)
+
+
+def test_replace_forget_and_prune(store):
+    classes = build_ir_from_json(AST, source_file="a.ts")
+    store.replace_file("a.ts", classes, 1, 1)
+    store.replace_file("a.ts", classes[:1], 2, 2)
+    store.replace_file("b.ts", build_ir_from_json(AST[:1], source_file="b.ts"), 1, 1)
+    assert store.count() == 2
+
+    store.forget("a.ts")
+    assert not store.is_current("a.ts", 2, 2)
+    assert [c.source_file for c in store.query()] == ["b.ts"]
+
+    assert store.prune(["a.ts"]) == 1
+    assert store.count() == 0
+
+
+def test_query_filters(store):
+    store.replace_file("a.ts", build_ir_from_json(AST, source_file="a.ts"), 1, 1)
+    controllers = list(store.query(kind="controller"))
+    assert [c.name for c in controllers] == ["UserController"]
+    assert list(store.query(route_prefix="/users")) == controllers
+    assert list(store.query(route_prefix="orders")) == []
+    assert [c.name for c in store.query(name="UserController")] == ["UserController"]
+    batches = list(store.iter_batches("controller", batch_size=1))
+    assert [len(b) for b in batches] == [1]
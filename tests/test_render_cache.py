@@ -0,0 +1,179 @@
+# tests/test_render_cache.py
+
+import copy
+import os
+
+import pytest
+
+from generators.controller_generator import ControllerGenerator
+from generators.dto_generator import DtoGenerator
+from generators.entity_generator import EntityGenerator
+from generators.render_cache import RenderCache
+from generators.repository_generator import RepositoryGenerator
+from generators.service_generator import ServiceGenerator
+from ir.ir_builder import build_ir_from_json
+
+PACKAGE = "com.example.demo"
+
+GENERATORS = {
+    "controller": (lambda out: ControllerGenerator(base_package=PACKAGE, base_output_dir=out), "UserController"),
+    "service": (lambda out: ServiceGenerator(base_package=PACKAGE, base_output_dir=out), "User"),
+    "dto": (lambda out: DtoGenerator(base_package=PACKAGE, base_output_dir=out), "CreateUserDto"),
+    "entity": (lambda out: EntityGenerator(base_package=PACKAGE, base_output_dir=out), "UserEntity"),
+    "repository": (lambda out: RepositoryGenerator(out, PACKAGE), "UserRepository"),
+}
+
+
+def record(name):
+    return {
+        "name": name,
+        "decorators": ["@Controller('users')"],
+        "extends": None,
+        "implements": [],
+        "properties": [
+            {"name": "id", "type": "number", "isReadonly": False, "access": "public", "decorators": []},
+            {"name": "email", "type": "string", "isReadonly": False, "access": "public", "decorators": ["@IsEmail()"]},
+        ],
+        "constructorParams": [{"name": "users", "type": "UserService", "decorators": []}],
+        "methods": [
+            {"name": "getOne", "returnType": "Promise<User>", "decorators": ["@Get(':id')"],
+             "parameters": [{"name": "id", "type": "string", "decorators": ["@Param('id')"]}]},
+        ],
+    }
+
+
+def prop(r):
+    return r["properties"][1]
+
+
+def method(r):
+    return r["methods"][0]
+
+
+def param(r):
+    return method(r)["parameters"][0]
+
+
+# Every IR field a generator could read, and one edit to it
+EDITS = {
+    "name": lambda r: r.__setitem__("name", "Admin" + r["name"]),
+    "decorator argument": lambda r: r.__setitem__("decorators", ["@Controller('accounts')"]),
+    "decorator option": lambda r: r.__setitem__("decorators", ["@Controller({ path: 'accounts' })"]),
+    "decorator name": lambda r: r.__setitem__("decorators", ["@Service()"]),
+    "extends": lambda r: r.__setitem__("extends", "BaseController"),
+    "implements": lambda r: r.__setitem__("implements", ["OnModuleInit"]),
+    "property name": lambda r: prop(r).__setitem__("name", "login"),
+    "property type": lambda r: prop(r).__setitem__("type", "Date"),
+    "id property": lambda r: r["properties"][0].__setitem__("name", "key"),
+    "property added": lambda r: r["properties"].append({**prop(r), "name": "tags", "type": "string[]"}),
+    "property readonly": lambda r: prop(r).__setitem__("isReadonly", True),
+    "property decorators": lambda r: prop(r).__setitem__("decorators", []),
+    "constructor params": lambda r: r["constructorParams"].clear(),
+    "method name": lambda r: method(r).__setitem__("name", "deleteOne"),
+    "method return type": lambda r: method(r).__setitem__("returnType", "User[]"),
+    "method decorators": lambda r: method(r).__setitem__("decorators", []),
+    "param name": lambda r: param(r).__setitem__("name", "userDto"),
+    "param type": lambda r: param(r).__setitem__("type", "CreateUserDto"),
+    "param decorators": lambda r: param(r).__setitem__("decorators", []),
+    "method added": lambda r: r["methods"].append({**method(r), "name": "create"}),
+}
+
+METHOD_EDITS = {"method name", "method return type", "param name", "param type", "method added"}
+PROPERTY_EDITS = {"property name", "property type", "id property", "property added"}
+
+# The edits each generator's render() output depends on
+READS = {
+    "controller": {"name", "decorator argument", "decorator option", "decorator name", "extends", "implements"}
+                  | METHOD_EDITS,
+    "service": {"name"} | METHOD_EDITS,
+    "dto": {"name"} | PROPERTY_EDITS,
+    "entity": {"name"} | PROPERTY_EDITS,
+    "repository": {"name"},
+}
+
+
+def build(data):
+    return build_ir_from_json([data], source_file="a.ts", lazy=True)[0]
+
+
+@pytest.mark.parametrize("kind", GENERATORS)
+def test_fingerprint_covers_every_field_render_reads(kind, tmp_path):
+    make, name = GENERATORS[kind]
+    generator = make(tmp_path)
+    cache = RenderCache(tmp_path / "cache")
+    base = record(name)
+
+    read = set()
+    for label, edit in EDITS.items():
+        edited = copy.deepcopy(base)
+        edit(edited)
+        rendered = generator.render(build(edited)) != generator.render(build(base))
+        if rendered:
+            read.add(label)
+            assert cache.key(generator, build(edited)) != cache.key(generator, build(base)), label
+    assert read == READS[kind]
+
+
+def test_key_covers_generator_version_and_config(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    ir_class = build(record("CreateUserDto"))
+    dto = DtoGenerator(PACKAGE, tmp_path)
+    key = cache.key(dto, ir_class)
+
+    assert cache.key(DtoGenerator("com.other", tmp_path), ir_class) != key
+    assert cache.key(EntityGenerator(PACKAGE, tmp_path), ir_class) != key
+    dto.VERSION = "2"
+    assert cache.key(dto, ir_class) != key
+
+
+def test_hits_misses_and_restores(tmp_path, capsys):
+    cache = RenderCache(tmp_path / "cache")
+    generator = DtoGenerator(PACKAGE, tmp_path / "out")
+    ir_class = build(record("CreateUserDto"))
+
+    [(rel_path, code)] = cache.generate_and_save(generator, ir_class)
+    output = tmp_path / "out" / rel_path
+    assert output.read_text() == code
+    assert (cache.hits, cache.misses, cache.restored) == (0, 1, 0)
+
+    capsys.readouterr()
+    assert cache.generate_and_save(generator, ir_class) == [(rel_path, code)]
+    assert "Up to date: CreateUserDto" in capsys.readouterr().out
+    assert (cache.hits, cache.misses, cache.restored) == (1, 1, 0)
+
+    output.unlink()
+    cache.generate_and_save(generator, ir_class)
+    output.write_text("// edited\n")
+    cache.generate_and_save(generator, ir_class)
+    assert output.read_text() == code
+    assert (cache.hits, cache.misses, cache.restored) == (3, 1, 2)
+
+    changed = record("CreateUserDto")
+    changed["properties"].pop()
+    cache.generate_and_save(generator, build(changed))
+    assert "email" not in output.read_text()
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    assert cache.report().startswith(
+        "🗃️  Render cache: 3 hit(s), 2 miss(es) (60% hit rate), 2 missing or edited file(s) restored, 0 evicted"
+    )
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    keys = [f"{i:02d}" + "0" * 62 for i in range(4)]
+    for age, key in enumerate(keys):
+        cache.put(key, [("A.java", "x" * 100)])
+        mtime = 1_000_000 + age
+        os.utime(cache._entry_path(key), (mtime, mtime))
+    entry_size = cache._entry_path(keys[0]).stat().st_size
+
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 2
+    assert [cache.get(key) is not None for key in keys] == [True, False, False, True]
+    assert (cache.evicted, cache.size_bytes) == (2, 2 * entry_size)
+    assert cache.report().endswith(f"2 evicted, {2 * entry_size / (1024 * 1024):.1f} MiB on disk")
+
+    assert cache.get("ff" + "0" * 62) is None
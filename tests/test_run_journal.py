@@ -0,0 +1,94 @@
+# tests/test_run_journal.py
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import main
+import ts_parser.async_runner as async_runner
+from utils.run_journal import JOURNAL_NAME, RunJournal
+
+DTO_PATH = Path("src/main/java/com/example/demo/dto/CreateUserDto.java")
+
+
+def dto_record(*fields):
+    return {
+        "name": "CreateUserDto",
+        "decorators": [],
+        "extends": None,
+        "implements": [],
+        "properties": [{"name": f, "type": "string", "isReadonly": False, "access": "public"} for f in fields],
+        "constructorParams": [],
+        "methods": [],
+    }
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Two sources that both generate CreateUserDto with different bodies."""
+    src = tmp_path / "src"
+    for rel in ["a/create-user.dto.ts", "b/create-user2.dto.ts", "c/other.dto.ts"]:
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel).write_text(f"// {rel}\n")
+    records = {
+        "create-user.dto.ts": [dto_record("email")],
+        "create-user2.dto.ts": [dto_record("name")],
+        "other.dto.ts": [{**dto_record("id"), "name": "OtherDto"}],
+    }
+
+    async def fake_parse(ts_file, *args):
+        return records[Path(ts_file).name]
+
+    monkeypatch.setattr(async_runner, "parse_file_async", fake_parse)
+    return tmp_path
+
+
+def convert(project, out, *extra):
+    args = main.build_parser().parse_args(
+        ["--input", str(project / "src"), "--lang", "java", "--output-dir", str(project / out), *extra]
+    )
+    assert asyncio.run(main.run(args)) == 0
+    return (project / out / DTO_PATH).read_text()
+
+
+def test_resume_matches_fresh_run_with_colliding_outputs(project, capsys):
+    fresh = convert(project, "fresh")
+    assert "name" in fresh and "email" not in fresh
+
+    convert(project, "resumed")
+    for _ in range(2):
+        assert convert(project, "resumed", "--resume") == fresh
+        assert "0 to go" in capsys.readouterr().out
+
+
+def test_resume_redoes_the_whole_collision_group(project, capsys):
+    fresh = convert(project, "out")
+    (project / "out" / DTO_PATH).write_text("// corrupted\n")
+    capsys.readouterr()
+
+    assert convert(project, "out", "--resume") == fresh
+    assert "1 file(s) already done, 2 to go" in capsys.readouterr().out
+
+
+def test_pending_ignores_outputs_owned_by_later_files(tmp_path):
+    for name in ("a.ts", "b.ts"):
+        (tmp_path / name).write_text(name)
+    a, b = str(tmp_path / "a.ts"), str(tmp_path / "b.ts")
+    output = tmp_path / "out" / "X.java"
+    output.parent.mkdir()
+
+    journal = RunJournal(tmp_path / "out", {})
+    for source, code in ((a, "from a"), (b, "from b")):
+        journal.record_parsed(source)
+        journal.record_generated(source, "X", "hash", [(output, code)])
+        journal.record_completed(source)
+        output.write_text(code)
+    journal.close()
+
+    resumed = RunJournal(tmp_path / "out", {}, resume=True)
+    assert resumed.pending([a, b]) == []
+    output.write_text("edited")
+    assert resumed.pending([a, b]) == [a, b]
+    resumed.close()
+    assert (tmp_path / "out" / JOURNAL_NAME).is_file()
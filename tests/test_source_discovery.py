@@ -0,0 +1,90 @@
+# tests/test_source_discovery.py
+
+import pytest
+
+from utils.source_discovery import SourceDiscovery, _compile, _excluded_by
+
+BASE = "/repo"
+
+
+@pytest.mark.parametrize("pattern, path, is_dir, matched", [
+    # Unanchored names match at any depth, and everything below them
+    ("gen", "/repo/gen", True, True),
+    ("gen", "/repo/src/gen", True, True),
+    ("gen", "/repo/src/gen/a.ts", False, True),
+    ("gen", "/repo/src/generated", True, False),
+    # A slash anchors the pattern to its base directory
+    ("/gen", "/repo/src/gen", True, False),
+    ("src/gen", "/repo/src/gen", True, True),
+    ("src/gen", "/repo/lib/src/gen", True, False),
+    # Trailing slash: directories only
+    ("gen/", "/repo/gen", True, True),
+    ("gen/", "/repo/gen", False, False),
+    # Wildcards
+    ("*.ts", "/repo/a/b.ts", False, True),
+    ("src/*.ts", "/repo/src/b.ts", False, True),
+    ("src/*.ts", "/repo/src/a/b.ts", False, False),
+    ("src/*/b.ts", "/repo/src/a/b.ts", False, True),
+    ("src/*/b.ts", "/repo/src/a/c/b.ts", False, False),
+    ("src/**/b.ts", "/repo/src/a/c/b.ts", False, True),
+    ("src/**/b.ts", "/repo/src/b.ts", False, True),
+    ("skip?.ts", "/repo/skip1.ts", False, True),
+    ("skip?.ts", "/repo/skip12.ts", False, False),
+    ("[ab].ts", "/repo/b.ts", False, True),
+    ("[!ab].ts", "/repo/b.ts", False, False),
+    # Outside the base directory
+    ("gen", "/other/gen", True, False),
+])
+def test_compile(pattern, path, is_dir, matched):
+    assert _compile(pattern, BASE, "test").matches(path, is_dir) is matched
+
+
+@pytest.mark.parametrize("patterns, path, reason", [
+    (["gen"], "/repo/gen", "rule 0"),
+    (["gen", "!gen"], "/repo/gen", None),
+    # Last matching rule wins
+    (["!gen", "gen"], "/repo/gen", "rule 1"),
+    (["*.ts", "!keep.ts"], "/repo/keep.ts", None),
+    (["*.ts", "!keep.ts"], "/repo/drop.ts", "rule 0"),
+    (["other"], "/repo/gen", None),
+])
+def test_excluded_by(patterns, path, reason):
+    rules = [_compile(p, BASE, f"rule {i}") for i, p in enumerate(patterns)]
+    assert _excluded_by(rules, path, is_dir=path.endswith("gen")) == reason
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel in ["src/a.ts", "src/a.spec.ts", "src/t.d.ts", "src/build/b.ts",
+                "src/node_modules/x/y.ts", "src/gen/g.ts", "src/keep.ts"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / "src" / ".gitignore").write_text("gen/\n")
+    return tmp_path
+
+
+def names(result):
+    return sorted(path.split("/src/", 1)[1] for path in result.files)
+
+
+def test_discover_defaults(tree):
+    result = SourceDiscovery().discover([str(tree)])
+    assert names(result) == ["a.ts", "keep.ts"]
+    assert result.skipped_files == {"test file": 1, "declaration file": 1}
+
+
+def test_default_excluded_dirs_can_be_negated(tree):
+    assert names(SourceDiscovery(exclude=["!build"]).discover([str(tree)])) == ["a.ts", "build/b.ts", "keep.ts"]
+    assert "node_modules/x/y.ts" in names(SourceDiscovery(excluded_dirs=()).discover([str(tree)]))
+
+
+def test_include_exclude_and_gitignore(tree):
+    assert names(SourceDiscovery(exclude=["keep.ts"]).discover([str(tree)])) == ["a.ts"]
+    assert names(SourceDiscovery(include=["**/keep.ts"]).discover([str(tree)])) == ["keep.ts"]
+    assert names(SourceDiscovery(use_gitignore=False).discover([str(tree)])) == ["a.ts", "gen/g.ts", "keep.ts"]
+
+
+def test_tsconfig_include_exclude(tree):
+    (tree / "tsconfig.json").write_text('{\n  // comment\n  "include": ["src/**/*"],\n  "exclude": ["**/keep.ts",],\n}\n')
+    assert names(SourceDiscovery(tsconfig=str(tree)).discover([str(tree)])) == ["a.ts"]
@@ -0,0 +1,122 @@
+# ts_parser/async_runner.py
+
+import asyncio
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+
+TS_PARSER_PATH = Path("ts_parser/ts_morph_bridge.js")
+
+
+class BridgeError(RuntimeError):
+    """Raised when the ts-morph bridge exits with a non-zero status."""
+
+
+@dataclass
+class ParseResult:
+    source_file: str
+    ast: Optional[list] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def parse_file_async(ts_file: str, bridge_path: Path = TS_PARSER_PATH) -> list:
+    """Parse a single TypeScript file (or pre-parsed JSON) without blocking the event loop."""
+    if ts_file.endswith(".json"):
+        return await asyncio.to_thread(_load_json, ts_file)
+
+    proc = await asyncio.create_subprocess_exec(
+        "node", str(bridge_path), "--input", ts_file,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await proc.communicate()
+    except BaseException:
+        # Cancelled mid-flight: don't leave orphaned node processes behind
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    if proc.returncode != 0:
+        message = stderr.decode(errors="replace").strip() or f"exit status {proc.returncode}"
+        raise BridgeError(message)
+    return json.loads(stdout)
+
+
+async def iter_parse_results(
+    ts_files: Iterable[str],
+    concurrency: int = 4,
+    queue_size: Optional[int] = None,
+    slots: Optional[asyncio.Semaphore] = None,
+) -> AsyncIterator[ParseResult]:
+    """
+    Parse files with at most `concurrency` bridge processes in flight and
+    yield results in input order, whatever order the processes finish in.
+    Finished results wait in a reorder buffer until every earlier file has
+    been yielded; workers only start a file while fewer than
+    `concurrency + queue_size` files are parsed ahead of the consumer, so a
+    slow file or a slow consumer stops new processes from being spawned.
+    Failures are yielded as results with `error` set instead of raising.
+    `slots`, when shared between several concurrent calls, caps the bridge
+    processes running across all of them.
+    """
+    concurrency = max(1, concurrency)
+    # Bounds files started but not yet yielded, so the queue itself never blocks
+    window = asyncio.Semaphore(concurrency + (queue_size or concurrency))
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = enumerate(ts_files)
+
+    async def worker():
+        while True:
+            await window.acquire()
+            item = next(pending, None)
+            if item is None:
+                window.release()
+                break
+            index, ts_file = item
+            try:
+                if slots is None:
+                    ast = await parse_file_async(ts_file)
+                else:
+                    async with slots:
+                        ast = await parse_file_async(ts_file)
+                result = ParseResult(ts_file, ast=ast)
+            except Exception as exc:
+                # Anything short of cancellation becomes a failed result; a worker
+                # that died without its sentinel would leave the consumer waiting forever
+                result = ParseResult(ts_file, error=str(exc) or type(exc).__name__)
+            queue.put_nowait((index, result))
+        queue.put_nowait(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    remaining = len(workers)
+    buffered = {}
+    next_index = 0
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+                continue
+            index, result = item
+            buffered[index] = result
+            while next_index in buffered:
+                result = buffered.pop(next_index)
+                next_index += 1
+                window.release()
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _load_json(path: str) -> list:
+    with open(path, "r") as f:
+        return json.load(f)
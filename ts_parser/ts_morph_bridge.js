@@ -37,7 +37,8 @@ const classes = sourceFile.getClasses().map(cls => {
       type: p.getType().getText(),
       isReadonly: p.isReadonly(),
       isStatic: p.isStatic(),
-      access: p.getScope() || "public"
+      access: p.getScope() || "public",
+      decorators: p.getDecorators().map(d => d.getFullText().trim())
     })),
     constructorParams: (cls.getConstructors()[0]?.getParameters() || []).map(p => ({
       name: p.getName(),
@@ -47,9 +48,11 @@ const classes = sourceFile.getClasses().map(cls => {
     methods: cls.getMethods().map(m => ({
       name: m.getName(),
       returnType: m.getReturnType().getText(),
+      decorators: m.getDecorators().map(d => d.getFullText().trim()),
       parameters: m.getParameters().map(p => ({
         name: p.getName(),
-        type: p.getType().getText()
+        type: p.getType().getText(),
+        decorators: p.getDecorators().map(d => d.getFullText().trim())
       }))
     }))
   };
@@ -0,0 +1,122 @@
+# utils/batch_config.py
+#
+# Batch config for converting several apps in one process, e.g. ts2many.toml:
+#
+#   parallel = 4                      # targets converted at once
+#   cache_dir = ".ts2many-cache"      # shared by every target
+#
+#   [defaults]                        # applied to every target
+#   lang = "java"
+#
+#   [[targets]]
+#   name = "users"
+#   input = ["apps/users/src"]
+#   output_dir = "out/users"
+#   package = "com.acme.users"
+#
+# Target keys are the command-line options (dashes or underscores).
+# Relative paths are resolved against the config file's directory.
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+# Settings that only make sense once per process; they may not vary by target
+BATCH_KEYS = {"parallel", "parse_concurrency", "cache_dir", "render_cache_max_mb"}
+PATH_KEYS = {"input", "output_dir", "tsconfig", "ir_store", "ir_output", "from_ir", "cache_dir"}
+LIST_KEYS = {"input", "include", "exclude", "only", "classes"}
+
+
+class BatchConfigError(ValueError):
+    """Raised when a batch config file is malformed."""
+
+
+@dataclass
+class BatchTarget:
+    name: str
+    settings: dict = field(default_factory=dict)
+
+
+@dataclass
+class BatchConfig:
+    targets: List[BatchTarget]
+    settings: dict = field(default_factory=dict)
+
+    @property
+    def parallel(self) -> int:
+        return self.settings.get("parallel", 1)
+
+
+def load_batch_config(path: str) -> BatchConfig:
+    toml = _toml_module()
+    config_path = Path(path)
+    try:
+        with open(config_path, "rb") as f:
+            data = toml.load(f)
+    except OSError as exc:
+        raise BatchConfigError(f"cannot read {path}: {exc.strerror}") from exc
+    except toml.TOMLDecodeError as exc:
+        raise BatchConfigError(f"{path}: {exc}") from exc
+
+    base_dir = config_path.parent
+    data = _normalize(data, base_dir, "top level")
+    defaults = _normalize(data.pop("defaults", {}), base_dir, "[defaults]")
+    raw_targets = data.pop("targets", [])
+    if not isinstance(raw_targets, list) or not raw_targets:
+        raise BatchConfigError(f"{path}: at least one [[targets]] entry is required")
+
+    settings = {key: data.pop(key) for key in BATCH_KEYS if key in data}
+    settings.update({key: defaults.pop(key) for key in BATCH_KEYS if key in defaults})
+    if data:
+        raise BatchConfigError(f"{path}: unknown top-level key(s) {', '.join(sorted(data))}; put target options under [defaults]")
+    for key in ("parallel", "parse_concurrency", "render_cache_max_mb"):
+        value = settings.get(key, 1)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise BatchConfigError(f"{path}: {key} must be a positive integer")
+
+    targets = []
+    names = set()
+    for i, raw in enumerate(raw_targets, start=1):
+        target = _normalize(raw, base_dir, f"target #{i}")
+        shared = BATCH_KEYS & target.keys()
+        if shared:
+            raise BatchConfigError(f"{path}: target #{i}: {', '.join(sorted(shared))} can only be set at the top level")
+        name = str(target.pop("name", None) or target.get("output_dir") or f"target-{i}")
+        if name in names:
+            raise BatchConfigError(f"{path}: duplicate target name {name!r}")
+        names.add(name)
+        targets.append(BatchTarget(name=name, settings={**defaults, **target}))
+    return BatchConfig(targets=targets, settings=settings)
+
+
+def _normalize(table, base_dir: Path, where: str) -> dict:
+    if not isinstance(table, dict):
+        raise BatchConfigError(f"{where}: expected a table")
+    normalized = {}
+    for key, value in table.items():
+        key = key.replace("-", "_")
+        if key in LIST_KEYS:
+            if isinstance(value, str):
+                value = [v.strip() for v in value.split(",")] if key in ("only", "classes") else [value]
+            if not isinstance(value, list):
+                raise BatchConfigError(f"{where}: {key} must be a string or a list")
+        if key in PATH_KEYS and value != "-":
+            value = [_resolve(v, base_dir) for v in value] if isinstance(value, list) else _resolve(value, base_dir)
+        normalized[key] = value
+    return normalized
+
+
+def _resolve(value, base_dir: Path) -> str:
+    path = Path(value)
+    return str(path if path.is_absolute() else base_dir / path)
+
+
+def _toml_module():
+    try:
+        import tomllib
+    except ModuleNotFoundError:
+        try:
+            import tomli as tomllib
+        except ImportError as exc:
+            raise BatchConfigError("reading batch configs requires Python 3.11+ or the 'tomli' package (pip install tomli)") from exc
+    return tomllib
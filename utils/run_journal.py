@@ -0,0 +1,157 @@
+# utils/run_journal.py
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+JOURNAL_NAME = ".ts2many-journal.jsonl"
+JOURNAL_VERSION = 3
+
+
+def sha256_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RunJournal:
+    """
+    Append-only JSON-lines journal in the output directory. Every input file
+    gets "parsed", then one "generated" entry per class (with its semantic
+    hash and output hashes) or "duplicate" entry per class skipped by dedup,
+    then "completed". With resume=True, files whose completed entry matches
+    the current input hash and whose outputs are still intact are skipped.
+    Files that had duplicates are always re-checked: the copy they deferred
+    to may have changed since.
+
+    Several files can write the same output path (a same-name collision).
+    Each path is owned by its last writer in discovery order, which is what
+    a fresh run leaves on disk; a file is not invalidated by a later file
+    overwriting its output. When one file of such a group has to be redone,
+    the whole group is, so the last writer still wins.
+    """
+
+    def __init__(self, output_dir: Path, config: dict, resume: bool = False):
+        self.path = Path(output_dir) / JOURNAL_NAME
+        self.config = {"journal_version": JOURNAL_VERSION, **config}
+        self.completed: Dict[str, str] = {}
+        self.outputs: Dict[str, List[Tuple[str, str]]] = {}
+        # source file -> (class name, semantic hash) of every class it generated
+        self.classes: Dict[str, List[Tuple[str, str]]] = {}
+        self.had_duplicates = set()
+        self.resumed = False
+        self._digests: Dict[str, str] = {}
+
+        if resume and self.path.is_file():
+            self.resumed = self._load()
+            if not self.resumed:
+                print("⚠️  Journal was written with different settings; starting a fresh run")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if self.resumed else "w", encoding="utf-8")
+        if not self.resumed:
+            self._append({"event": "run", "config": self.config})
+
+    def _load(self) -> bool:
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    continue
+        if not entries or entries[0].get("event") != "run" or entries[0].get("config") != self.config:
+            return False
+
+        for entry in entries[1:]:
+            event = entry.get("event")
+            source = entry.get("file")
+            if event == "parsed":
+                # A re-parse supersedes whatever an earlier attempt generated
+                self.outputs[source] = []
+                self.classes[source] = []
+                self.had_duplicates.discard(source)
+                self.completed.pop(source, None)
+            elif event == "generated":
+                self.outputs.setdefault(source, []).extend((o["path"], o["sha256"]) for o in entry["outputs"])
+                self.classes.setdefault(source, []).append((entry["class"], entry["hash"]))
+            elif event == "duplicate":
+                self.had_duplicates.add(source)
+            elif event == "completed":
+                self.completed[source] = entry["sha256"]
+        return True
+
+    def digest(self, source_file: str) -> str:
+        if source_file not in self._digests:
+            self._digests[source_file] = sha256_file(source_file)
+        return self._digests[source_file]
+
+    def pending(self, source_files: List[str]) -> List[str]:
+        """The files in `source_files` (in discovery order) that still need work."""
+        owners: Dict[str, str] = {}
+        writers: Dict[str, List[str]] = {}
+        for source in source_files:
+            for path, _ in self.outputs.get(source, []):
+                owners[path] = source
+                writers.setdefault(path, []).append(source)
+
+        redo = {source for source in source_files if not self._is_done(source, owners)}
+        queue = list(redo)
+        while queue:
+            for path, _ in self.outputs.get(queue.pop(), []):
+                for other in writers[path]:
+                    if other not in redo:
+                        redo.add(other)
+                        queue.append(other)
+        return [source for source in source_files if source in redo]
+
+    def _is_done(self, source_file: str, owners: Dict[str, str]) -> bool:
+        """True if `source_file` is unchanged since it completed and the outputs it owns are intact."""
+        if source_file in self.had_duplicates:
+            return False
+        recorded = self.completed.get(source_file)
+        if recorded is None or recorded != self.digest(source_file):
+            return False
+        for path, expected in self.outputs.get(source_file, []):
+            if owners.get(path) != source_file:
+                continue
+            try:
+                if sha256_file(path) != expected:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def record_parsed(self, source_file: str):
+        self._append({"event": "parsed", "file": source_file, "sha256": self.digest(source_file)})
+
+    def record_generated(self, source_file: str, class_name: str, digest: str, outputs: List[Tuple[Path, str]]):
+        self._append({
+            "event": "generated",
+            "file": source_file,
+            "class": class_name,
+            "hash": digest,
+            "outputs": [{"path": str(path), "sha256": sha256_text(code)} for path, code in outputs],
+        })
+
+    def record_duplicate(self, source_file: str, class_name: str, digest: str):
+        self._append({"event": "duplicate", "file": source_file, "class": class_name, "hash": digest})
+
+    def record_completed(self, source_file: str):
+        self._append({"event": "completed", "file": source_file, "sha256": self.digest(source_file)})
+
+    def close(self):
+        self._file.close()
+
+    def _append(self, entry: dict):
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        # Flush per entry so a crash or kill loses at most the entry in flight
+        self._file.flush()
@@ -0,0 +1,276 @@
+# utils/source_discovery.py
+
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+DEFAULT_EXCLUDED_DIRS = {
+    "node_modules", "dist", "build", "out", "coverage", ".nyc_output",
+    ".git", ".hg", ".svn", ".idea", ".vscode", ".cache", ".next", ".turbo",
+}
+
+# Suffix -> skip reason. Checked before any pattern matching since they are the common case.
+SKIPPED_SUFFIXES = {
+    ".d.ts": "declaration file",
+    ".spec.ts": "test file",
+    ".test.ts": "test file",
+}
+
+
+@dataclass(frozen=True)
+class _Rule:
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    base: str  # absolute POSIX directory the pattern is relative to
+    reason: str
+
+    def matches(self, abs_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not abs_path.startswith(self.base + "/"):
+                return False
+            abs_path = abs_path[len(self.base) + 1:]
+        return self.regex.match(abs_path) is not None
+
+
+@dataclass
+class DiscoveryResult:
+    files: List[str] = field(default_factory=list)
+    skipped_files: Counter = field(default_factory=Counter)
+    pruned_dirs: Counter = field(default_factory=Counter)
+
+    def report(self) -> List[str]:
+        lines = []
+        for reason, count in sorted(self.skipped_files.items()):
+            lines.append(f"   - {count} file(s): {reason}")
+        for reason, count in sorted(self.pruned_dirs.items()):
+            lines.append(f"   - {count} dir(s) pruned: {reason}")
+        return lines
+
+
+class SourceDiscovery:
+    """
+    os.scandir based replacement for Path.rglob("*.ts").
+    Excluded directories are pruned before they are entered, so nothing under
+    node_modules/dist/... is ever listed. The default excluded directories act
+    as the lowest-priority rules, so a "!build" exclude or .gitignore
+    negation brings a directory back.
+    """
+
+    def __init__(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        tsconfig: Optional[str] = None,
+        use_gitignore: bool = True,
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+    ):
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.use_gitignore = use_gitignore
+        self.excluded_dirs = sorted(excluded_dirs)
+        self.tsconfig_include: List[_Rule] = []
+        self.tsconfig_exclude: List[_Rule] = []
+        if tsconfig:
+            self._load_tsconfig(tsconfig)
+
+    def discover(self, inputs: Iterable[str]) -> DiscoveryResult:
+        result = DiscoveryResult()
+        seen = set()
+        for input_path in inputs:
+            if os.path.isdir(input_path):
+                files = self._walk(input_path, result)
+            elif os.path.isfile(input_path) and input_path.endswith(".ts"):
+                # Explicitly named files bypass all filters
+                files = [input_path]
+            else:
+                continue
+            for file in files:
+                key = os.path.abspath(file)
+                if key not in seen:
+                    seen.add(key)
+                    result.files.append(file)
+        return result
+
+    def _walk(self, root: str, result: DiscoveryResult) -> List[str]:
+        root_abs = Path(root).resolve().as_posix()
+        include_rules = [_compile(p, root_abs, "not matched by --include") for p in self.include]
+        exclude_rules = [_compile(p, root_abs, "--exclude pattern") for p in self.exclude]
+        exclude_rules.extend(self.tsconfig_exclude)
+        default_rules = [
+            _compile(f"{name}/", root_abs, f"default excluded directory ({name})") for name in self.excluded_dirs
+        ]
+
+        files = []
+        # (display path, absolute path, active .gitignore rules)
+        stack = [(root, root_abs, [])]
+        while stack:
+            display_dir, abs_dir, ignore_rules = stack.pop()
+            if self.use_gitignore:
+                gitignore = os.path.join(abs_dir, ".gitignore")
+                if os.path.isfile(gitignore):
+                    ignore_rules = ignore_rules + _read_gitignore(gitignore, abs_dir)
+            rules = default_rules + ignore_rules + exclude_rules
+
+            try:
+                entries = sorted(os.scandir(abs_dir), key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                abs_path = f"{abs_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    reason = _excluded_by(rules, abs_path, is_dir=True)
+                    if reason:
+                        result.pruned_dirs[reason] += 1
+                        continue
+                    subdirs.append((os.path.join(display_dir, entry.name), abs_path, ignore_rules))
+                    continue
+
+                if not entry.name.endswith(".ts") or not entry.is_file():
+                    continue
+                reason = self._skip_reason(entry.name, abs_path, rules, include_rules)
+                if reason:
+                    result.skipped_files[reason] += 1
+                    continue
+                files.append(os.path.join(display_dir, entry.name))
+
+            # Reverse so directories are visited in name order
+            stack.extend(reversed(subdirs))
+        return files
+
+    def _skip_reason(self, name: str, abs_path: str, rules: List[_Rule], include_rules: List[_Rule]) -> Optional[str]:
+        for suffix, reason in SKIPPED_SUFFIXES.items():
+            if name.endswith(suffix):
+                return reason
+        reason = _excluded_by(rules, abs_path, is_dir=False)
+        if reason:
+            return reason
+        if include_rules and not any(rule.matches(abs_path, False) for rule in include_rules):
+            return include_rules[0].reason
+        if self.tsconfig_include and not any(rule.matches(abs_path, False) for rule in self.tsconfig_include):
+            return self.tsconfig_include[0].reason
+        return None
+
+    def _load_tsconfig(self, tsconfig: str):
+        path = Path(tsconfig)
+        if path.is_dir():
+            path = path / "tsconfig.json"
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.loads(_strip_json_comments(f.read()))
+
+        base = path.parent.resolve().as_posix()
+        for pattern in config.get("include", []):
+            self.tsconfig_include.append(_compile(_anchor(pattern), base, "not in tsconfig include"))
+        for pattern in config.get("exclude", []):
+            self.tsconfig_exclude.append(_compile(_anchor(pattern), base, "tsconfig exclude"))
+
+
+def _excluded_by(rules: List[_Rule], abs_path: str, is_dir: bool) -> Optional[str]:
+    # gitignore semantics: the last matching rule wins, "!" re-includes
+    reason = None
+    for rule in rules:
+        if rule.matches(abs_path, is_dir):
+            reason = None if rule.negate else rule.reason
+    return reason
+
+
+def _read_gitignore(path: str, base: str) -> List[_Rule]:
+    rules = []
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\n").rstrip()
+            if line and not line.startswith("#"):
+                rules.append(_compile(line, base, ".gitignore"))
+    return rules
+
+
+def _anchor(pattern: str) -> str:
+    pattern = pattern[2:] if pattern.startswith("./") else pattern
+    return "/" + pattern.lstrip("/")
+
+
+def _compile(pattern: str, base: str, reason: str) -> _Rule:
+    negate = pattern.startswith("!")
+    if negate:
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    # A slash anywhere but the end anchors the pattern to its base directory
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    regex = _glob_to_regex(pattern)
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    # Matching a directory also matches everything below it
+    regex = f"{regex}(?:/.*)?$"
+    return _Rule(re.compile(regex), negate, dir_only, base, reason)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def _strip_json_comments(text: str) -> str:
+    """tsconfig.json allows comments and trailing commas; plain json does not."""
+    out = []
+    i = 0
+    in_string = False
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if ch == "\\":
+                out.append(text[i + 1:i + 2])
+                i += 2
+                continue
+            if ch == '"':
+                in_string = False
+            i += 1
+        elif ch == '"':
+            in_string = True
+            out.append(ch)
+            i += 1
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = len(text) if end == -1 else end
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = len(text) if end == -1 else end + 2
+        else:
+            out.append(ch)
+            i += 1
+    return re.sub(r",(\s*[}\]])", r"\1", "".join(out))